@@ -29,4 +29,11 @@ async def main():
     print(result.final_output)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop for a faster event loop when it is available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    asyncio.run(main())
@@ -23,7 +23,8 @@ from src.github import (
     get_repository,
     list_issues,
     create_issue,
-    list_pull_requests
+    list_pull_requests,
+    aclose as close_github_client
 )
 
 
@@ -89,11 +90,15 @@ async def main():
     
     # Run the orchestrator agent with a user query
     print("Running orchestrator agent...")
-    result = await Runner.run(
-        orchestrator_agent,
-        "I want to list my EC2 instances in us-west-2 and then check for open issues in my example-org/example-repo GitHub repository.",
-        context=context
-    )
+    try:
+        result = await Runner.run(
+            orchestrator_agent,
+            "I want to list my EC2 instances in us-west-2 and then check for open issues in my example-org/example-repo GitHub repository.",
+            context=context
+        )
+    finally:
+        # Close the GitHub tools' pooled connections before the event loop closes
+        await close_github_client()
     
     # Print the result
     print("\nFinal output:")
@@ -7,9 +7,17 @@ It shows how to create function tools for GitHub operations and use them with an
 
 import os
 import json
-from typing import List, Dict, Any, Optional
-from github import Github, Repository, Issue, PullRequest
-from pydantic import BaseModel, Field
+import time
+import atexit
+import asyncio
+import weakref
+import threading
+import functools
+import contextlib
+from typing import List, Dict, Any, Optional, Tuple
+import httpx
+import orjson
+from pydantic import AliasPath, BaseModel, ConfigDict, Field, field_validator, model_validator
 
 # Import OpenAI Agents SDK
 from agents import Agent, Runner, function_tool
@@ -22,43 +30,180 @@ set_tracing_disabled(True)
 if "OPENAI_API_KEY" not in os.environ:
     raise ValueError("OPENAI_API_KEY environment variable is required")
 
+# Read the GitHub token once, failing fast if it is missing
+GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+if not GITHUB_TOKEN:
+    raise ValueError("GITHUB_TOKEN environment variable is required")
+
+# GitHub API endpoints
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Default number of issues or pull requests returned by the list tools
+LIST_LIMIT = 10
+
+# GraphQL queries, selecting only the fields mapped into our models
+REPOSITORY_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    name
+    nameWithOwner
+    description
+    url
+    defaultBranchRef { name }
+    stargazerCount
+    forkCount
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    primaryLanguage { name }
+  }
+}
+"""
+
+ISSUES_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $states: [IssueState!], $labels: [String!]) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $first, states: $states, labels: $labels, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number
+        title
+        body
+        state
+        createdAt
+        updatedAt
+        url
+        labels(first: 10) { nodes { name } }
+        assignees(first: 10) { nodes { login } }
+      }
+    }
+  }
+}
+"""
+
+PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $states: [PullRequestState!]) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: $first, states: $states, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number
+        title
+        body
+        state
+        createdAt
+        updatedAt
+        url
+        baseRefName
+        headRefName
+        mergeable
+      }
+    }
+  }
+}
+"""
+
+# REST state filters mapped to GraphQL enum values (None means no filter)
+ISSUE_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED"],
+    "all": None
+}
+
+PR_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "all": None
+}
+
+# Cache settings for idempotent GitHub reads
+CACHE_TTL = 60  # 1 minute
+CACHE_MAX_SIZE = 1024
+
+# Requests are held back until the rate limit resets once fewer than this
+# many requests remain in the current window
+RATE_LIMIT_THRESHOLD = 10
+
+# Connection pool limits shared by the GitHub HTTP clients
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100)
+
+# GraphQL mergeable values mapped to the REST representation
+PR_MERGEABLE = {
+    "MERGEABLE": True,
+    "CONFLICTING": False,
+    "UNKNOWN": None
+}
+
 # Define Pydantic models for GitHub operations
+# Response models accept raw GitHub REST payloads through validation aliases
 class GitHubRepository(BaseModel):
     """Model representing a GitHub repository."""
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+    
     name: str = Field(..., description="The name of the repository")
     full_name: str = Field(..., description="The full name of the repository (owner/name)")
     description: Optional[str] = Field(None, description="The description of the repository")
-    url: str = Field(..., description="The URL of the repository")
+    url: str = Field(..., validation_alias="html_url", description="The URL of the repository")
     default_branch: str = Field(..., description="The default branch of the repository")
-    stars: int = Field(..., description="The number of stars the repository has")
-    forks: int = Field(..., description="The number of forks the repository has")
-    open_issues: int = Field(..., description="The number of open issues in the repository")
+    stars: int = Field(..., validation_alias="stargazers_count", description="The number of stars the repository has")
+    forks: int = Field(..., validation_alias="forks_count", description="The number of forks the repository has")
+    open_issues: int = Field(..., validation_alias="open_issues_count", description="The number of open issues in the repository")
     language: Optional[str] = Field(None, description="The primary language of the repository")
 
 class GitHubIssue(BaseModel):
     """Model representing a GitHub issue."""
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+    
     number: int = Field(..., description="The issue number")
     title: str = Field(..., description="The title of the issue")
     body: Optional[str] = Field(None, description="The body of the issue")
     state: str = Field(..., description="The state of the issue (open or closed)")
     created_at: str = Field(..., description="The creation date of the issue")
     updated_at: str = Field(..., description="The last update date of the issue")
-    url: str = Field(..., description="The URL of the issue")
+    url: str = Field(..., validation_alias="html_url", description="The URL of the issue")
     labels: List[str] = Field(default_factory=list, description="The labels of the issue")
     assignees: List[str] = Field(default_factory=list, description="The assignees of the issue")
+    
+    @field_validator("labels", mode="before")
+    @classmethod
+    def _label_names(cls, labels: List[Any]) -> List[str]:
+        """Reduce REST label objects to their names."""
+        return [label["name"] if isinstance(label, dict) else label for label in labels]
+    
+    @field_validator("assignees", mode="before")
+    @classmethod
+    def _assignee_logins(cls, assignees: List[Any]) -> List[str]:
+        """Reduce REST user objects to their logins."""
+        return [user["login"] if isinstance(user, dict) else user for user in assignees]
 
 class GitHubPullRequest(BaseModel):
     """Model representing a GitHub pull request."""
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+    
     number: int = Field(..., description="The pull request number")
     title: str = Field(..., description="The title of the pull request")
     body: Optional[str] = Field(None, description="The body of the pull request")
     state: str = Field(..., description="The state of the pull request (open, closed, or merged)")
     created_at: str = Field(..., description="The creation date of the pull request")
     updated_at: str = Field(..., description="The last update date of the pull request")
-    url: str = Field(..., description="The URL of the pull request")
-    base_branch: str = Field(..., description="The base branch of the pull request")
-    head_branch: str = Field(..., description="The head branch of the pull request")
+    url: str = Field(..., validation_alias="html_url", description="The URL of the pull request")
+    base_branch: str = Field(..., validation_alias=AliasPath("base", "ref"), description="The base branch of the pull request")
+    head_branch: str = Field(..., validation_alias=AliasPath("head", "ref"), description="The head branch of the pull request")
     mergeable: Optional[bool] = Field(None, description="Whether the pull request is mergeable")
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _merged_state(cls, data: Any) -> Any:
+        """Report merged REST pull requests as "merged" rather than "closed"."""
+        if isinstance(data, dict) and data.get("merged_at"):
+            return {**data, "state": "merged"}
+        return data
+
+class GitHubRepoOverview(BaseModel):
+    """Model for a GitHub repository with its open issues and pull requests."""
+    model_config = ConfigDict(frozen=True)
+    
+    repository: GitHubRepository = Field(..., description="The repository information")
+    issues: List[GitHubIssue] = Field(..., description="The open issues")
+    pull_requests: List[GitHubPullRequest] = Field(..., description="The open pull requests")
 
 class GitHubRepoRequest(BaseModel):
     """Model for requesting GitHub repository operations."""
@@ -72,6 +217,7 @@ class GitHubIssueRequest(BaseModel):
     issue_number: Optional[int] = Field(None, description="The issue number (for specific issue operations)")
     state: Optional[str] = Field(None, description="The state filter (open, closed, or all)")
     labels: Optional[List[str]] = Field(None, description="The labels filter")
+    limit: Optional[int] = Field(LIST_LIMIT, ge=1, le=100, description="The maximum number of issues to list (1-100)")
 
 class GitHubPRRequest(BaseModel):
     """Model for requesting GitHub pull request operations."""
@@ -79,6 +225,7 @@ class GitHubPRRequest(BaseModel):
     repo: str = Field(..., description="The name of the repository")
     pr_number: Optional[int] = Field(None, description="The pull request number (for specific PR operations)")
     state: Optional[str] = Field(None, description="The state filter (open, closed, or all)")
+    limit: Optional[int] = Field(LIST_LIMIT, ge=1, le=100, description="The maximum number of pull requests to list (1-100)")
 
 class GitHubCreateIssueRequest(BaseModel):
     """Model for creating a GitHub issue."""
@@ -89,8 +236,269 @@ class GitHubCreateIssueRequest(BaseModel):
     labels: Optional[List[str]] = Field(None, description="The labels to apply to the issue")
     assignees: Optional[List[str]] = Field(None, description="The users to assign to the issue")
 
+# Shared HTTP client for GraphQL and REST requests
+_http_client = httpx.Client(
+    base_url=GITHUB_API_URL,
+    headers={"Accept": "application/vnd.github+json"},
+    http2=True,
+    limits=HTTP_LIMITS,
+    timeout=30.0
+)
+
+# Remaining requests and reset time (epoch seconds) per rate limit resource
+_rate_limits: Dict[str, Tuple[int, int]] = {}
+
+def _update_rate_limit(resource: str, response: httpx.Response) -> None:
+    """Record the rate limit state reported in a GitHub response."""
+    remaining = response.headers.get("X-RateLimit-Remaining")
+    reset = response.headers.get("X-RateLimit-Reset")
+    if remaining is not None and reset is not None:
+        _rate_limits[resource] = (int(remaining), int(reset))
+
+def _rate_limit_delay(resource: str) -> float:
+    """
+    Get how long to wait before the next request to a rate limit resource.
+    
+    Args:
+        resource: Rate limit resource ("core" for REST, "graphql" for GraphQL)
+        
+    Returns:
+        Seconds until the rate limit resets if the remaining quota is below
+        RATE_LIMIT_THRESHOLD, otherwise 0
+    """
+    state = _rate_limits.get(resource)
+    if not state or state[0] >= RATE_LIMIT_THRESHOLD:
+        return 0.0
+    return max(0.0, state[1] - time.time())
+
+def _wait_for_rate_limit(resource: str) -> None:
+    """Block until a request to the rate limit resource can be made."""
+    delay = _rate_limit_delay(resource)
+    if delay:
+        time.sleep(delay)
+
+@contextlib.asynccontextmanager
+async def _rate_gate(resource: str):
+    """
+    Hold back an async request until the rate limit resource has quota.
+    
+    Pacing requests ahead of the limit avoids spending round-trips on 403
+    responses and the backoff that follows them.
+    
+    Args:
+        resource: Rate limit resource ("core" for REST, "graphql" for GraphQL)
+    """
+    delay = _rate_limit_delay(resource)
+    if delay:
+        await asyncio.sleep(delay)
+    yield
+
+def _gh_graphql(query: str, variables: Dict[str, Any], token: str) -> Dict[str, Any]:
+    """
+    Run a query against the GitHub GraphQL API.
+    
+    Args:
+        query: GraphQL query document
+        variables: Variables for the query
+        token: GitHub personal access token
+        
+    Returns:
+        The "data" object of the GraphQL response
+        
+    Raises:
+        ValueError: If the GraphQL API returns errors
+    """
+    _wait_for_rate_limit("graphql")
+    response = _http_client.post(
+        GITHUB_GRAPHQL_URL,
+        json={"query": query, "variables": variables},
+        headers={"Authorization": f"bearer {token}"}
+    )
+    _update_rate_limit("graphql", response)
+    response.raise_for_status()
+    
+    result = orjson.loads(response.content)
+    if result.get("errors"):
+        messages = "; ".join(error.get("message", "") for error in result["errors"])
+        raise ValueError(f"GitHub GraphQL query failed: {messages}")
+    
+    return result["data"]
+
+# Validators and parsed bodies of GET responses, keyed by full request URL
+_etag_cache: Dict[str, Tuple[Optional[str], Optional[str], Any]] = {}
+
+def _conditional_headers(
+    cached: Optional[Tuple[Optional[str], Optional[str], Any]]
+) -> Dict[str, str]:
+    """
+    Get the conditional request headers for a previously fetched URL.
+    
+    Args:
+        cached: The URL's _etag_cache entry, or None if it is not cached
+        
+    Returns:
+        If-None-Match / If-Modified-Since headers, empty if the URL is not cached
+    """
+    if not cached:
+        return {}
+    
+    etag, last_modified, _ = cached
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+def _parse_conditional_response(
+    url: str,
+    response: httpx.Response,
+    cached: Optional[Tuple[Optional[str], Optional[str], Any]]
+) -> Any:
+    """
+    Parse the response to a conditional GET request.
+    
+    A 304 Not Modified response carries no body and does not count against the
+    primary rate limit; the previously parsed body is returned instead.
+    
+    Args:
+        url: Full request URL, including the query string
+        response: Response to the request
+        cached: The _etag_cache entry the conditional headers were built from;
+                passed in because it may be evicted while the request is in flight
+        
+    Returns:
+        Parsed JSON response
+    """
+    if response.status_code == 304 and cached:
+        return cached[2]
+    
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _etag_cache.pop(url, None)
+        if len(_etag_cache) >= CACHE_MAX_SIZE:
+            _etag_cache.pop(next(iter(_etag_cache)))
+        _etag_cache[url] = (etag, last_modified, data)
+    
+    return data
+
+def _gh_rest(
+    method: str,
+    path: str,
+    token: str,
+    params: Optional[Dict[str, Any]] = None,
+    body: Optional[Dict[str, Any]] = None
+) -> Any:
+    """
+    Make a request to the GitHub REST API using the shared client.
+    
+    Args:
+        method: HTTP method
+        path: API path relative to the REST API root (e.g. "/repos/{owner}/{repo}")
+        token: GitHub personal access token
+        params: Query parameters
+        body: JSON request body
+        
+    Returns:
+        Parsed JSON response
+    """
+    request = _http_client.build_request(
+        method,
+        path,
+        params=params,
+        json=body,
+        headers={"Authorization": f"token {token}"}
+    )
+    url = str(request.url)
+    cached = _etag_cache.get(url) if method == "GET" else None
+    request.headers.update(_conditional_headers(cached))
+    
+    _wait_for_rate_limit("core")
+    response = _http_client.send(request)
+    _update_rate_limit("core", response)
+    
+    if method == "GET":
+        return _parse_conditional_response(url, response, cached)
+    
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+# Cache of tool results keyed by (tool name, serialized request)
+_tool_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+def _cache_get(key: Tuple[str, str], ttl: int) -> Any:
+    """Get a cached tool result, or None if it is missing or expired."""
+    cached = _tool_cache.get(key)
+    if cached and time.time() - cached["timestamp"] < ttl:
+        return cached["data"]
+    return None
+
+def _cache_set(key: Tuple[str, str], data: Any) -> None:
+    """Cache a tool result, evicting the oldest entry when the cache is full."""
+    _tool_cache.pop(key, None)
+    if len(_tool_cache) >= CACHE_MAX_SIZE:
+        _tool_cache.pop(next(iter(_tool_cache)))
+    _tool_cache[key] = {"timestamp": time.time(), "data": data}
+
+def _cache_invalidate_repo(owner: str, repo: str) -> None:
+    """Drop every cached tool result for a repository, e.g. after creating an issue."""
+    for key in list(_tool_cache):
+        request = orjson.loads(key[1])
+        if request.get("owner") == owner and request.get("repo") == repo:
+            _tool_cache.pop(key, None)
+
+def _copy_result(result: Any) -> Any:
+    """Copy a cached list so callers can't change the cached one; the models are frozen."""
+    return list(result) if isinstance(result, list) else result
+
+def _cached(ttl: int = CACHE_TTL):
+    """
+    Cache the results of an idempotent GitHub tool for a short time.
+    
+    The agent tends to repeat the same read calls across turns, so results are
+    reused for `ttl` seconds instead of going back to the network. Works for
+    both sync and async tools taking a single Pydantic request argument.
+    
+    Args:
+        ttl: Time to live for cached results in seconds
+        
+    Returns:
+        Decorator for the tool function
+    """
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(request):
+                key = (func.__name__, request.model_dump_json())
+                result = _cache_get(key, ttl)
+                if result is None:
+                    result = await func(request)
+                    _cache_set(key, result)
+                return _copy_result(result)
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(request):
+            key = (func.__name__, request.model_dump_json())
+            result = _cache_get(key, ttl)
+            if result is None:
+                result = func(request)
+                _cache_set(key, result)
+            return _copy_result(result)
+        return wrapper
+    return decorator
+
+def clear_tool_cache() -> None:
+    """Clear all cached tool results."""
+    _tool_cache.clear()
+
 # Create GitHub function tools
 @function_tool()
+@_cached()
 def get_repository(request: GitHubRepoRequest) -> GitHubRepository:
     """
     Get information about a GitHub repository.
@@ -101,30 +509,30 @@ def get_repository(request: GitHubRepoRequest) -> GitHubRepository:
     Returns:
         Repository information
     """
-    # Create GitHub client
-    github_token = os.environ.get("GITHUB_TOKEN")
-    if not github_token:
-        raise ValueError("GITHUB_TOKEN environment variable is required")
-    
-    g = Github(github_token)
-    
-    # Get repository
-    repo = g.get_repo(f"{request.owner}/{request.repo}")
-    
-    # Create GitHubRepository object
-    return GitHubRepository(
-        name=repo.name,
-        full_name=repo.full_name,
-        description=repo.description,
-        url=repo.html_url,
-        default_branch=repo.default_branch,
-        stars=repo.stargazers_count,
-        forks=repo.forks_count,
-        open_issues=repo.open_issues_count,
-        language=repo.language
+    # Get repository with a single GraphQL query
+    data = _gh_graphql(
+        REPOSITORY_QUERY,
+        {"owner": request.owner, "name": request.repo},
+        GITHUB_TOKEN
+    )
+    repo = data["repository"]
+    
+    # Create GitHubRepository object without re-validating the GraphQL data
+    return GitHubRepository.model_construct(
+        name=repo["name"],
+        full_name=repo["nameWithOwner"],
+        description=repo["description"],
+        url=repo["url"],
+        default_branch=(repo["defaultBranchRef"] or {}).get("name", ""),
+        stars=repo["stargazerCount"],
+        forks=repo["forkCount"],
+        # REST counts open pull requests as open issues, so keep that behavior
+        open_issues=repo["issues"]["totalCount"] + repo["pullRequests"]["totalCount"],
+        language=(repo["primaryLanguage"] or {}).get("name")
     )
 
 @function_tool()
+@_cached()
 def list_issues(request: GitHubIssueRequest) -> List[GitHubIssue]:
     """
     List issues in a GitHub repository.
@@ -135,44 +543,39 @@ def list_issues(request: GitHubIssueRequest) -> List[GitHubIssue]:
     Returns:
         List of issues
     """
-    # Create GitHub client
-    github_token = os.environ.get("GITHUB_TOKEN")
-    if not github_token:
-        raise ValueError("GITHUB_TOKEN environment variable is required")
-    
-    g = Github(github_token)
-    
-    # Get repository
-    repo = g.get_repo(f"{request.owner}/{request.repo}")
-    
-    # Prepare parameters for get_issues
-    params = {}
-    if request.state:
-        params['state'] = request.state
-    if request.labels:
-        params['labels'] = request.labels
-    
-    # Get issues
-    issues = repo.get_issues(**params)
+    # Get issues with a single GraphQL query
+    data = _gh_graphql(
+        ISSUES_QUERY,
+        {
+            "owner": request.owner,
+            "name": request.repo,
+            "first": request.limit or LIST_LIMIT,
+            "states": ISSUE_STATES.get(request.state or "open", ["OPEN"]),
+            "labels": request.labels
+        },
+        GITHUB_TOKEN
+    )
     
-    # Create GitHubIssue objects
+    # Create GitHubIssue objects; the fields are built here from a typed
+    # GraphQL response, so validation is skipped
     result = []
-    for issue in issues[:10]:  # Limit to 10 issues
-        result.append(GitHubIssue(
-            number=issue.number,
-            title=issue.title,
-            body=issue.body,
-            state=issue.state,
-            created_at=issue.created_at.isoformat(),
-            updated_at=issue.updated_at.isoformat(),
-            url=issue.html_url,
-            labels=[label.name for label in issue.labels],
-            assignees=[assignee.login for assignee in issue.assignees]
+    for issue in data["repository"]["issues"]["nodes"]:
+        result.append(GitHubIssue.model_construct(
+            number=issue["number"],
+            title=issue["title"],
+            body=issue["body"],
+            state=issue["state"].lower(),
+            created_at=issue["createdAt"],
+            updated_at=issue["updatedAt"],
+            url=issue["url"],
+            labels=[label["name"] for label in issue["labels"]["nodes"]],
+            assignees=[assignee["login"] for assignee in issue["assignees"]["nodes"]]
         ))
     
     return result
 
 @function_tool()
+@_cached()
 def get_issue(request: GitHubIssueRequest) -> GitHubIssue:
     """
     Get a specific issue from a GitHub repository.
@@ -183,34 +586,18 @@ def get_issue(request: GitHubIssueRequest) -> GitHubIssue:
     Returns:
         Issue information
     """
-    # Create GitHub client
-    github_token = os.environ.get("GITHUB_TOKEN")
-    if not github_token:
-        raise ValueError("GITHUB_TOKEN environment variable is required")
-    
-    g = Github(github_token)
-    
-    # Get repository
-    repo = g.get_repo(f"{request.owner}/{request.repo}")
-    
-    # Get issue
+    # Get issue with a single REST call
     if not request.issue_number:
         raise ValueError("issue_number is required")
     
-    issue = repo.get_issue(request.issue_number)
+    issue = _gh_rest(
+        "GET",
+        f"/repos/{request.owner}/{request.repo}/issues/{request.issue_number}",
+        GITHUB_TOKEN
+    )
     
     # Create GitHubIssue object
-    return GitHubIssue(
-        number=issue.number,
-        title=issue.title,
-        body=issue.body,
-        state=issue.state,
-        created_at=issue.created_at.isoformat(),
-        updated_at=issue.updated_at.isoformat(),
-        url=issue.html_url,
-        labels=[label.name for label in issue.labels],
-        assignees=[assignee.login for assignee in issue.assignees]
-    )
+    return GitHubIssue.model_validate(issue)
 
 @function_tool()
 def create_issue(request: GitHubCreateIssueRequest) -> GitHubIssue:
@@ -223,38 +610,28 @@ def create_issue(request: GitHubCreateIssueRequest) -> GitHubIssue:
     Returns:
         Created issue information
     """
-    # Create GitHub client
-    github_token = os.environ.get("GITHUB_TOKEN")
-    if not github_token:
-        raise ValueError("GITHUB_TOKEN environment variable is required")
-    
-    g = Github(github_token)
-    
-    # Get repository
-    repo = g.get_repo(f"{request.owner}/{request.repo}")
-    
-    # Create issue
-    issue = repo.create_issue(
-        title=request.title,
-        body=request.body,
-        labels=request.labels,
-        assignees=request.assignees
+    # Create issue with a single REST call
+    body = {"title": request.title, "body": request.body}
+    if request.labels:
+        body["labels"] = request.labels
+    if request.assignees:
+        body["assignees"] = request.assignees
+    
+    issue = _gh_rest(
+        "POST",
+        f"/repos/{request.owner}/{request.repo}/issues",
+        GITHUB_TOKEN,
+        body=body
     )
     
-    # Create GitHubIssue object
-    return GitHubIssue(
-        number=issue.number,
-        title=issue.title,
-        body=issue.body,
-        state=issue.state,
-        created_at=issue.created_at.isoformat(),
-        updated_at=issue.updated_at.isoformat(),
-        url=issue.html_url,
-        labels=[label.name for label in issue.labels],
-        assignees=[assignee.login for assignee in issue.assignees]
-    )
+    # Cached issue lists and counts for the repository no longer include the new issue
+    _cache_invalidate_repo(request.owner, request.repo)
+    
+    # Create GitHubIssue object, keeping GitHub's ISO 8601 timestamps as-is
+    return GitHubIssue.model_validate(issue)
 
 @function_tool()
+@_cached()
 def list_pull_requests(request: GitHubPRRequest) -> List[GitHubPullRequest]:
     """
     List pull requests in a GitHub repository.
@@ -265,41 +642,317 @@ def list_pull_requests(request: GitHubPRRequest) -> List[GitHubPullRequest]:
     Returns:
         List of pull requests
     """
-    # Create GitHub client
-    github_token = os.environ.get("GITHUB_TOKEN")
-    if not github_token:
-        raise ValueError("GITHUB_TOKEN environment variable is required")
+    # Get pull requests with a single GraphQL query
+    data = _gh_graphql(
+        PULL_REQUESTS_QUERY,
+        {
+            "owner": request.owner,
+            "name": request.repo,
+            "first": request.limit or LIST_LIMIT,
+            "states": PR_STATES.get(request.state or "open", ["OPEN"])
+        },
+        GITHUB_TOKEN
+    )
     
-    g = Github(github_token)
+    # Create GitHubPullRequest objects; the fields are built here from a typed
+    # GraphQL response, so validation is skipped
+    result = []
+    for pr in data["repository"]["pullRequests"]["nodes"]:
+        result.append(GitHubPullRequest.model_construct(
+            number=pr["number"],
+            title=pr["title"],
+            body=pr["body"],
+            state=pr["state"].lower(),
+            created_at=pr["createdAt"],
+            updated_at=pr["updatedAt"],
+            url=pr["url"],
+            base_branch=pr["baseRefName"],
+            head_branch=pr["headRefName"],
+            mergeable=PR_MERGEABLE.get(pr["mergeable"])
+        ))
+    
+    return result
+
+# Async GitHub helpers
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client for the running event loop.
     
-    # Get repository
-    repo = g.get_repo(f"{request.owner}/{request.repo}")
+    httpx clients are bound to the loop they were first used on, so one client
+    is kept per loop and reused by every async tool running on it. HTTP/2 lets
+    concurrent tool calls multiplex over a single connection to api.github.com.
     
-    # Prepare parameters for get_pulls
-    params = {}
+    Returns:
+        Async HTTP client for the GitHub REST API
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            headers={"Accept": "application/vnd.github+json"},
+            http2=True,
+            limits=HTTP_LIMITS,
+            timeout=30.0
+        )
+        _async_clients[loop] = client
+    return client
+
+async def _gh_rest_async(
+    method: str,
+    path: str,
+    token: str,
+    params: Optional[Dict[str, Any]] = None,
+    body: Optional[Dict[str, Any]] = None
+) -> Any:
+    """
+    Make a request to the GitHub REST API using the shared async client.
+    
+    Args:
+        method: HTTP method
+        path: API path relative to the REST API root (e.g. "/repos/{owner}/{repo}")
+        token: GitHub personal access token
+        params: Query parameters
+        body: JSON request body
+        
+    Returns:
+        Parsed JSON response
+    """
+    client = _get_async_client()
+    request = client.build_request(
+        method,
+        path,
+        params=params,
+        json=body,
+        headers={"Authorization": f"token {token}"}
+    )
+    url = str(request.url)
+    cached = _etag_cache.get(url) if method == "GET" else None
+    request.headers.update(_conditional_headers(cached))
+    
+    async with _rate_gate("core"):
+        response = await client.send(request)
+    _update_rate_limit("core", response)
+    
+    if method == "GET":
+        return _parse_conditional_response(url, response, cached)
+    
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def _close_http_clients() -> None:
+    """Close the shared HTTP clients at interpreter exit."""
+    _http_client.close()
+    for loop, client in list(_async_clients.items()):
+        if not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(client.aclose())
+
+atexit.register(_close_http_clients)
+
+def _store_rate_limits(data: Dict[str, Any]) -> None:
+    """Record the rate limit state from a GET /rate_limit response body."""
+    for resource in ("core", "graphql"):
+        state = data.get("resources", {}).get(resource)
+        if state:
+            _rate_limits[resource] = (state["remaining"], state["reset"])
+
+def _warm_up() -> None:
+    """
+    Open the connection to api.github.com ahead of the first tool call.
+    
+    GET /rate_limit does not count against the rate limit, so it is used to
+    complete DNS, TCP and TLS setup early and to seed the rate limit state.
+    Failures are ignored; the first real request will simply connect itself.
+    """
+    try:
+        response = _http_client.get("/rate_limit", headers={"Authorization": f"token {GITHUB_TOKEN}"})
+        response.raise_for_status()
+        _store_rate_limits(orjson.loads(response.content))
+    except httpx.HTTPError:
+        pass
+
+async def _warm_up_async() -> None:
+    """Async variant of _warm_up for the shared client of the running loop."""
+    try:
+        response = await _get_async_client().get("/rate_limit", headers={"Authorization": f"token {GITHUB_TOKEN}"})
+        response.raise_for_status()
+        _store_rate_limits(orjson.loads(response.content))
+    except httpx.HTTPError:
+        pass
+
+# Warm up the connection in the background so importing stays fast
+_warm_up_tasks = set()
+try:
+    _warm_up_task = asyncio.get_running_loop().create_task(_warm_up_async())
+    _warm_up_tasks.add(_warm_up_task)
+    _warm_up_task.add_done_callback(_warm_up_tasks.discard)
+except RuntimeError:
+    threading.Thread(target=_warm_up, daemon=True).start()
+
+# Create async GitHub function tools
+@_cached()
+async def _fetch_repository(request: GitHubRepoRequest) -> GitHubRepository:
+    """Fetch a repository from the GitHub REST API."""
+    repo = await _gh_rest_async(
+        "GET",
+        f"/repos/{request.owner}/{request.repo}",
+        GITHUB_TOKEN
+    )
+    return GitHubRepository.model_validate(repo)
+
+@_cached()
+async def _fetch_issues(request: GitHubIssueRequest) -> List[GitHubIssue]:
+    """Fetch the issues of a repository from the GitHub REST API."""
+    params = {"per_page": request.limit or LIST_LIMIT}
     if request.state:
-        params['state'] = request.state
+        params["state"] = request.state
+    if request.labels:
+        params["labels"] = ",".join(request.labels)
     
-    # Get pull requests
-    pulls = repo.get_pulls(**params)
+    issues = await _gh_rest_async(
+        "GET",
+        f"/repos/{request.owner}/{request.repo}/issues",
+        GITHUB_TOKEN,
+        params=params
+    )
     
-    # Create GitHubPullRequest objects
-    result = []
-    for pr in pulls[:10]:  # Limit to 10 PRs
-        result.append(GitHubPullRequest(
-            number=pr.number,
-            title=pr.title,
-            body=pr.body,
-            state="merged" if pr.merged else pr.state,
-            created_at=pr.created_at.isoformat(),
-            updated_at=pr.updated_at.isoformat(),
-            url=pr.html_url,
-            base_branch=pr.base.ref,
-            head_branch=pr.head.ref,
-            mergeable=pr.mergeable
-        ))
+    # The issues endpoint also returns pull requests, which are skipped here
+    return [
+        GitHubIssue.model_validate(issue)
+        for issue in issues
+        if "pull_request" not in issue
+    ]
+
+@function_tool()
+@_cached()
+async def get_issue_async(request: GitHubIssueRequest) -> GitHubIssue:
+    """
+    Get a specific issue from a GitHub repository.
     
-    return result
+    Args:
+        request: Parameters for the issue request
+        
+    Returns:
+        Issue information
+    """
+    if not request.issue_number:
+        raise ValueError("issue_number is required")
+    
+    issue = await _gh_rest_async(
+        "GET",
+        f"/repos/{request.owner}/{request.repo}/issues/{request.issue_number}",
+        GITHUB_TOKEN
+    )
+    return GitHubIssue.model_validate(issue)
+
+@function_tool()
+async def create_issue_async(request: GitHubCreateIssueRequest) -> GitHubIssue:
+    """
+    Create a new issue in a GitHub repository.
+    
+    Args:
+        request: Parameters for creating the issue
+        
+    Returns:
+        Created issue information
+    """
+    body = {"title": request.title, "body": request.body}
+    if request.labels:
+        body["labels"] = request.labels
+    if request.assignees:
+        body["assignees"] = request.assignees
+    
+    issue = await _gh_rest_async(
+        "POST",
+        f"/repos/{request.owner}/{request.repo}/issues",
+        GITHUB_TOKEN,
+        body=body
+    )
+    
+    # Cached issue lists and counts for the repository no longer include the new issue
+    _cache_invalidate_repo(request.owner, request.repo)
+    return GitHubIssue.model_validate(issue)
+
+@_cached()
+async def _fetch_pull_requests(request: GitHubPRRequest) -> List[GitHubPullRequest]:
+    """Fetch the pull requests of a repository from the GitHub REST API."""
+    params = {"per_page": request.limit or LIST_LIMIT}
+    if request.state:
+        params["state"] = request.state
+    
+    pulls = await _gh_rest_async(
+        "GET",
+        f"/repos/{request.owner}/{request.repo}/pulls",
+        GITHUB_TOKEN,
+        params=params
+    )
+    return [GitHubPullRequest.model_validate(pr) for pr in pulls]
+
+@function_tool()
+async def get_repository_async(request: GitHubRepoRequest) -> GitHubRepository:
+    """
+    Get information about a GitHub repository.
+    
+    Args:
+        request: Parameters for the repository request
+        
+    Returns:
+        Repository information
+    """
+    return await _fetch_repository(request)
+
+@function_tool()
+async def list_issues_async(request: GitHubIssueRequest) -> List[GitHubIssue]:
+    """
+    List issues in a GitHub repository.
+    
+    Args:
+        request: Parameters for the issue request
+        
+    Returns:
+        List of issues
+    """
+    return await _fetch_issues(request)
+
+@function_tool()
+async def list_pull_requests_async(request: GitHubPRRequest) -> List[GitHubPullRequest]:
+    """
+    List pull requests in a GitHub repository.
+    
+    Args:
+        request: Parameters for the pull request request
+        
+    Returns:
+        List of pull requests
+    """
+    return await _fetch_pull_requests(request)
+
+@function_tool()
+async def get_repo_overview(request: GitHubRepoRequest) -> GitHubRepoOverview:
+    """
+    Get a repository together with its open issues and pull requests.
+    
+    The three lookups are made concurrently, so this is faster than calling
+    get_repository_async, list_issues_async and list_pull_requests_async in turn.
+    
+    Args:
+        request: Parameters for the repository request
+        
+    Returns:
+        Repository information with its open issues and pull requests
+    """
+    repository, issues, pull_requests = await asyncio.gather(
+        _fetch_repository(request),
+        _fetch_issues(GitHubIssueRequest(owner=request.owner, repo=request.repo, state="open")),
+        _fetch_pull_requests(GitHubPRRequest(owner=request.owner, repo=request.repo, state="open"))
+    )
+    return GitHubRepoOverview.model_construct(
+        repository=repository,
+        issues=issues,
+        pull_requests=pull_requests
+    )
 
 # Create GitHub agent
 github_agent = Agent(
@@ -312,9 +965,19 @@ github_agent = Agent(
     When getting repository information, provide a summary of the repository including its name, description, stars, forks, and open issues.
     When creating issues, guide the user through the required parameters and confirm the creation.
     
+    When asked for an overview of a repository, prefer get_repo_overview over calling the individual
+    repository, issue and pull request tools, since it fetches them all at once.
+    
     Always be helpful and provide clear explanations of GitHub concepts when needed.
     """,
-    tools=[get_repository, list_issues, get_issue, create_issue, list_pull_requests],
+    tools=[
+        get_repository_async,
+        list_issues_async,
+        get_issue_async,
+        create_issue_async,
+        list_pull_requests_async,
+        get_repo_overview
+    ],
     model="gpt-4o"
 )
 
@@ -341,4 +1004,11 @@ def run_github_agent_example():
         print(f"{message.role}: {message.content}")
 
 if __name__ == "__main__":
+    # Use uvloop for a faster event loop when it is available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     run_github_agent_example()
\ No newline at end of file
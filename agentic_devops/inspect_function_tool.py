@@ -9,15 +9,8 @@ def test_func():
     """Test function."""
     return "Hello, world!"
 
-print("Type:", type(test_func))
-print("Dir:", dir(test_func))
-
-# Try to find a way to access the original function
-for attr in dir(test_func):
-    if not attr.startswith('__'):
-        try:
-            value = getattr(test_func, attr)
-            if callable(value):
-                print(f"Callable attribute: {attr}")
-        except Exception as e:
-            print(f"Error accessing {attr}: {e}")
\ No newline at end of file
+if __name__ == "__main__":
+    print("Type:", type(test_func))
+    print("Name:", test_func.name)
+    print("Description:", test_func.description)
+    print("Params JSON schema:", test_func.params_json_schema)
@@ -16,6 +16,17 @@ with open(os.path.join("src", "__init__.py"), "r", encoding="utf-8") as f:
 with open("README.md", "r", encoding="utf-8") as f:
     long_description = f.read()
 
+# Compile the CLI and the GitHub models with Cython when it is installed;
+# otherwise the pure-Python modules are used as-is
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [os.path.join("src", "cli.py"), os.path.join("src", "github", "github_models.py")],
+        language_level=3
+    )
+except ImportError:
+    ext_modules = []
+
 # Read requirements from requirements.txt
 with open("requirements.txt", "r", encoding="utf-8") as f:
     requirements = [line.strip() for line in f if line.strip() and not line.startswith("#")]
@@ -32,6 +43,11 @@ setup(
     packages=find_packages(),
     package_dir={"": "src"},
     install_requires=requirements,
+    extras_require={
+        "hyperscan": ["hyperscan>=0.4.0"],
+        "brotli": ["brotli>=1.0.9"],
+    },
+    ext_modules=ext_modules,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -5,101 +5,69 @@ This package includes modules for AWS services, GitHub integration, and other De
 tools, designed to be used with the OpenAI Agents SDK.
 """
 
-from .aws import (
-    # EC2 Models
-    EC2InstanceFilter,
-    EC2StartStopRequest,
-    EC2CreateRequest,
-    EC2Instance,
-    
-    # EC2 Tools
-    list_ec2_instances,
-    start_ec2_instances,
-    stop_ec2_instances,
-    create_ec2_instance
-)
-
-from .github import (
-    # GitHub Models
-    GitHubRepoRequest,
-    GitHubIssueRequest,
-    GitHubCreateIssueRequest,
-    GitHubPRRequest,
-    GitHubRepository,
-    GitHubIssue,
-    GitHubPullRequest,
-    
-    # GitHub Tools
-    get_repository,
-    list_issues,
-    create_issue,
-    list_pull_requests
-)
-
-from .core import (
-    # Context
-    DevOpsContext,
-    
-    # Config
-    get_config,
-    get_config_value,
-    set_config_value,
-    load_config,
-    
-    # Credentials
-    AWSCredentials,
-    GitHubCredentials,
-    CredentialManager,
-    get_credential_manager,
-    set_credential_manager,
-    
-    # Guardrails
-    security_guardrail,
-    sensitive_info_guardrail,
-    SecurityCheckOutput,
-    SensitiveInfoOutput
-)
+import importlib
+from typing import Any, List
 
-__all__ = [
+# Subpackage that provides each re-exported name. The subpackages pull in boto3,
+# the HTTP stack and the Agents SDK, so they are only imported when one of their
+# names is first used; importing src.cli for --help stays fast.
+_LAZY_IMPORTS = {
     # AWS EC2
-    'EC2InstanceFilter',
-    'EC2StartStopRequest',
-    'EC2CreateRequest',
-    'EC2Instance',
-    'list_ec2_instances',
-    'start_ec2_instances',
-    'stop_ec2_instances',
-    'create_ec2_instance',
+    'EC2InstanceFilter': 'aws',
+    'EC2StartStopRequest': 'aws',
+    'EC2CreateRequest': 'aws',
+    'EC2Instance': 'aws',
+    'list_ec2_instances': 'aws',
+    'start_ec2_instances': 'aws',
+    'stop_ec2_instances': 'aws',
+    'create_ec2_instance': 'aws',
     
     # GitHub
-    'GitHubRepoRequest',
-    'GitHubIssueRequest',
-    'GitHubCreateIssueRequest',
-    'GitHubPRRequest',
-    'GitHubRepository',
-    'GitHubIssue',
-    'GitHubPullRequest',
-    'get_repository',
-    'list_issues',
-    'create_issue',
-    'list_pull_requests',
+    'GitHubRepoRequest': 'github',
+    'GitHubIssueRequest': 'github',
+    'GitHubCreateIssueRequest': 'github',
+    'GitHubPRRequest': 'github',
+    'GitHubRepository': 'github',
+    'GitHubIssue': 'github',
+    'GitHubPullRequest': 'github',
+    'get_repository': 'github',
+    'list_issues': 'github',
+    'create_issue': 'github',
+    'list_pull_requests': 'github',
     
     # Core
-    'DevOpsContext',
-    'get_config',
-    'get_config_value',
-    'set_config_value',
-    'load_config',
-    'AWSCredentials',
-    'GitHubCredentials',
-    'CredentialManager',
-    'get_credential_manager',
-    'set_credential_manager',
-    'security_guardrail',
-    'sensitive_info_guardrail',
-    'SecurityCheckOutput',
-    'SensitiveInfoOutput'
-]
+    'DevOpsContext': 'core',
+    'get_config': 'core',
+    'get_config_value': 'core',
+    'set_config_value': 'core',
+    'load_config': 'core',
+    'AWSCredentials': 'core',
+    'GitHubCredentials': 'core',
+    'CredentialManager': 'core',
+    'get_credential_manager': 'core',
+    'set_credential_manager': 'core',
+    'security_guardrail': 'core',
+    'sensitive_info_guardrail': 'core',
+    'SecurityCheckOutput': 'core',
+    'SensitiveInfoOutput': 'core'
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name from its subpackage on first access."""
+    subpackage = _LAZY_IMPORTS.get(name)
+    if subpackage is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{subpackage}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+__all__ = list(_LAZY_IMPORTS)
 
 # Version
 __version__ = '0.1.0'
\ No newline at end of file
@@ -5,8 +5,10 @@ This module implements function tools for listing, starting, stopping, and creat
 EC2 instances, designed to be used with the OpenAI Agents SDK.
 """
 
+import asyncio
 import boto3
 import logging
+import threading
 from typing import Dict, List, Any, Optional
 
 from agents import function_tool, RunContextWrapper
@@ -22,6 +24,51 @@ from ..core.context import DevOpsContext
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# EC2 clients by region. boto3 sessions are not thread-safe, so clients are
+# built from a private session under a lock; once built they are safe to share.
+_clients: Dict[Optional[str], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_ec2_client(region: Optional[str]) -> Any:
+    """
+    Get the shared EC2 client for a region, creating it on first use.
+    
+    Args:
+        region: AWS region
+        
+    Returns:
+        boto3 EC2 client
+    """
+    with _clients_lock:
+        client = _clients.get(region)
+        if client is None:
+            client = boto3.session.Session().client("ec2", region_name=region)
+            _clients[region] = client
+        return client
+
+
+async def _call_ec2(region: Optional[str], operation: str, **kwargs: Any) -> Dict[str, Any]:
+    """
+    Call an EC2 API operation in a worker thread.
+    
+    boto3 is blocking, both when creating the client and when calling it, so
+    running it directly in a tool would stall every other coroutine on the loop.
+    
+    Args:
+        region: AWS region
+        operation: EC2 client method name (e.g., "describe_instances")
+        **kwargs: Arguments for the operation
+        
+    Returns:
+        AWS API response
+    """
+    def call() -> Dict[str, Any]:
+        ec2_client = _get_ec2_client(region)
+        return getattr(ec2_client, operation)(**kwargs)
+    
+    return await asyncio.get_running_loop().run_in_executor(None, call)
+
 
 @function_tool()
 async def list_ec2_instances(
@@ -40,9 +87,6 @@ async def list_ec2_instances(
     """
     logger.info(f"Listing EC2 instances in region {filter_params.region}")
     
-    # Create EC2 client
-    ec2_client = boto3.client("ec2", region_name=filter_params.region)
-    
     # Prepare filters
     kwargs = {}
     
@@ -56,7 +100,7 @@ async def list_ec2_instances(
         kwargs['Filters'] = aws_filters
     
     # Call AWS API
-    response = ec2_client.describe_instances(**kwargs)
+    response = await _call_ec2(filter_params.region, "describe_instances", **kwargs)
     
     # Process response
     instances = []
@@ -86,11 +130,8 @@ async def start_ec2_instances(
     """
     logger.info(f"Starting EC2 instances: {request.instance_ids}")
     
-    # Create EC2 client
-    ec2_client = boto3.client("ec2", region_name=request.region)
-    
     # Call AWS API
-    response = ec2_client.start_instances(InstanceIds=request.instance_ids)
+    response = await _call_ec2(request.region, "start_instances", InstanceIds=request.instance_ids)
     
     logger.info(f"Started EC2 instances: {request.instance_ids}")
     return response
@@ -113,11 +154,10 @@ async def stop_ec2_instances(
     """
     logger.info(f"Stopping EC2 instances: {request.instance_ids}")
     
-    # Create EC2 client
-    ec2_client = boto3.client("ec2", region_name=request.region)
-    
     # Call AWS API
-    response = ec2_client.stop_instances(
+    response = await _call_ec2(
+        request.region,
+        "stop_instances",
         InstanceIds=request.instance_ids,
         Force=request.force
     )
@@ -143,9 +183,6 @@ async def create_ec2_instance(
     """
     logger.info(f"Creating EC2 instance of type {request.instance_type} in region {request.region}")
     
-    # Create EC2 client
-    ec2_client = boto3.client("ec2", region_name=request.region)
-    
     # Prepare run_instances parameters
     run_args = {
         'ImageId': request.image_id,
@@ -187,7 +224,7 @@ async def create_ec2_instance(
         run_args['TagSpecifications'] = tag_specs
     
     # Call AWS API
-    response = ec2_client.run_instances(**run_args)
+    response = await _call_ec2(request.region, "run_instances", **run_args)
     
     logger.info(f"Created EC2 instance: {response['Instances'][0]['InstanceId']}")
     return response
\ No newline at end of file
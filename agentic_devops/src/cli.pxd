@@ -0,0 +1,12 @@
+# Type declarations used when cli.py is compiled with Cython (see setup.py).
+# cli.py stays plain Python; these only speed up the compiled build.
+
+import cython
+
+cpdef str _format_cell(object value)
+
+@cython.locals(header=str, lines=list)
+cpdef str _format_table(headers, rows)
+
+@cython.locals(keys=dict, ordered_keys=list)
+cpdef format_output(data, format_type=*)
@@ -11,22 +11,35 @@ import sys
 import argparse
 import logging
 import json
+import functools
 from typing import Dict, Any, Optional, List
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
+from . import __version__
 from .core.config import get_config, ConfigError
 from .core.credentials import get_credential_manager, CredentialError
-from .aws.base import AWSServiceError, ResourceNotFoundError, PermissionDeniedError, ValidationError, RateLimitError, ResourceLimitError
-from .github.github import GitHubError, AuthenticationError
-from .aws.ec2 import EC2Service
-from .github.github import GitHubService
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+
+# The AWS and GitHub service modules pull in boto3 and the HTTP stack, so they
+# are imported by the command handlers that need them rather than here. This
+# keeps --help and argument errors fast.
+
+# Silent unless main() configures logging, so embedding applications that
+# import this module keep control of their own logging setup
 logger = logging.getLogger('devops-agent')
+logger.addHandler(logging.NullHandler())
+
+def _configure_logging(debug: bool = False) -> None:
+    """
+    Configure logging for a CLI run.
+    
+    Args:
+        debug: Whether to enable debug logging
+    """
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
 
 # ANSI color codes for terminal output
 COLORS = {
@@ -41,20 +54,134 @@ COLORS = {
     'bold': '\033[1m'
 }
 
+# Whether to write ANSI colors: only to a terminal that supports them, and
+# never when NO_COLOR is set (https://no-color.org)
+_USE_COLOR = (
+    hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+    and not os.environ.get('NO_COLOR')
+    and os.environ.get('TERM') != 'dumb'
+)
+
+# Colors used for output, resolved once; empty when colors are disabled
+_COLOR_CODES = COLORS if _USE_COLOR else dict.fromkeys(COLORS, '')
+_RED = _COLOR_CODES['red']
+_GREEN = _COLOR_CODES['green']
+_YELLOW = _COLOR_CODES['yellow']
+_CYAN = _COLOR_CODES['cyan']
+_RESET = _COLOR_CODES['reset']
+_BOLD = _COLOR_CODES['bold']
+
+class _FastArgumentParser(argparse.ArgumentParser):
+    """
+    ArgumentParser that reuses one help formatter while arguments are added.
+    
+    From Python 3.14, add_argument builds help formatters to validate each new
+    argument, and building a formatter probes the environment for color
+    support. Validation does not change the formatter's state, so one cached
+    instance is shared until help or usage text is actually rendered.
+    Subparsers inherit the parser class, so nested parsers get this as well.
+    """
+    
+    _cached_formatter = None
+    
+    def _get_formatter(self):
+        if self._cached_formatter is None:
+            self._cached_formatter = super()._get_formatter()
+        return self._cached_formatter
+    
+    def format_usage(self):
+        self._cached_formatter = None
+        try:
+            return super().format_usage()
+        finally:
+            self._cached_formatter = None
+    
+    def format_help(self):
+        self._cached_formatter = None
+        try:
+            return super().format_help()
+        finally:
+            self._cached_formatter = None
+
+# Older Pythons do not build formatters in add_argument, so keep the stock parser there
+_ArgumentParser = _FastArgumentParser if sys.version_info >= (3, 14) else argparse.ArgumentParser
+
 def print_error(message: str, details: Optional[str] = None, suggestion: Optional[str] = None) -> None:
     """
-    Print a formatted error message to the console.
+    Print a formatted error message to stderr in a single write.
     
     Args:
         message: The main error message
         details: Optional details about the error
         suggestion: Optional suggestion for resolving the error
     """
-    print(f"{COLORS['red']}{COLORS['bold']}ERROR: {message}{COLORS['reset']}")
+    lines = [f"{_RED}{_BOLD}ERROR: {message}{_RESET}"]
     if details:
-        print(f"{details}")
+        lines.append(details)
     if suggestion:
-        print(f"\n{COLORS['yellow']}SUGGESTION: {suggestion}{COLORS['reset']}")
+        lines.append(f"\n{_YELLOW}SUGGESTION: {suggestion}{_RESET}")
+    sys.stderr.write('\n'.join(lines) + '\n')
+
+def _handle_credential_error(error: Exception) -> int:
+    """Report a credential error."""
+    # Extract error type from the message
+    if "AWS" in str(error):
+        error_type = "AWS credentials error"
+    elif "GitHub" in str(error):
+        error_type = "GitHub credentials error"
+    else:
+        error_type = "Credential error"
+    print_error(error_type, f"Error: {error}", getattr(error, 'suggestion', None))
+    return 1
+
+def _handle_github_auth_error(error: Exception) -> int:
+    """Report a GitHub authentication error."""
+    print_error(
+        "GitHub authentication failed",
+        f"Error: {error}",
+        "Check your GitHub token or set the GITHUB_TOKEN environment variable."
+    )
+    return 1
+
+def _handle_github_error(error: Exception) -> int:
+    """Report a GitHub service error."""
+    if "Organization is required" in str(error):
+        print_error(
+            "GitHub organization or user required",
+            f"Error: {error}",
+            "Specify an organization with --org or a user with --user."
+        )
+    elif "Repository owner is required" in str(error):
+        print_error(
+            "Repository owner required",
+            f"Error: {error}",
+            "Specify the repository owner with --owner or use the full repository path (owner/repo)."
+        )
+    else:
+        print_error(f"GitHub error", f"Error: {error}")
+    return 1
+
+def _handle_aws_error(error: Exception) -> int:
+    """Report an AWS service error."""
+    error_type = error.__class__.__name__
+    print_error(f"AWS operation failed: {error_type}", f"Error: {error}", getattr(error, 'suggestion', None))
+    return 1
+
+# Error handlers keyed by exception class. The service exception handlers are
+# registered the first time an error from that service is handled, since the
+# service modules are imported lazily by the command handlers.
+_ERROR_HANDLERS = {CredentialError: _handle_credential_error}
+
+def _register_service_error_handlers(error: Exception) -> None:
+    """Register the handlers for the service module an error came from."""
+    error_module = type(error).__module__
+    if error_module.startswith(f"{__package__}.github"):
+        from .github.github import GitHubError, AuthenticationError
+        _ERROR_HANDLERS[AuthenticationError] = _handle_github_auth_error
+        _ERROR_HANDLERS[GitHubError] = _handle_github_error
+    elif error_module.startswith(f"{__package__}.aws"):
+        from .aws.base import AWSServiceError
+        _ERROR_HANDLERS[AWSServiceError] = _handle_aws_error
 
 def handle_cli_error(error: Exception) -> int:
     """
@@ -69,54 +196,20 @@ def handle_cli_error(error: Exception) -> int:
     # Log the full error for debugging
     logger.debug(f"Error details: {error}", exc_info=True)
     
-    # Handle credential errors
-    if isinstance(error, CredentialError):
-        # Extract error type from the message
-        if "AWS" in str(error):
-            error_type = "AWS credentials error"
-        elif "GitHub" in str(error):
-            error_type = "GitHub credentials error"
-        else:
-            error_type = "Credential error"
-        print_error(error_type, f"Error: {error}", getattr(error, 'suggestion', None))
-        return 1
-    
-    # Handle GitHub errors
-    elif isinstance(error, GitHubError):
-        if isinstance(error, AuthenticationError):
-            print_error(
-                "GitHub authentication failed",
-                f"Error: {error}",
-                "Check your GitHub token or set the GITHUB_TOKEN environment variable."
-            )
-        elif "Organization is required" in str(error):
-            print_error(
-                "GitHub organization or user required",
-                f"Error: {error}",
-                "Specify an organization with --org or a user with --user."
-            )
-        elif "Repository owner is required" in str(error):
-            print_error(
-                "Repository owner required",
-                f"Error: {error}",
-                "Specify the repository owner with --owner or use the full repository path (owner/repo)."
-            )
-        else:
-            print_error(f"GitHub error", f"Error: {error}")
-        return 1
-    # Handle AWS service errors
-    elif isinstance(error, AWSServiceError):
-        error_type = error.__class__.__name__
-        print_error(f"AWS operation failed: {error_type}", f"Error: {error}", getattr(error, 'suggestion', None))
-        return 1
+    _register_service_error_handlers(error)
+    
+    # Use the handler for the most specific registered class of the error
+    for cls in type(error).__mro__:
+        handler = _ERROR_HANDLERS.get(cls)
+        if handler:
+            return handler(error)
     
     # Handle other errors
-    else:
-        print_error(f"Unexpected error", f"Error: {error}")
-        return 1
+    print_error(f"Unexpected error", f"Error: {error}")
+    return 1
 
 def setup_ec2_parser(subparsers):
-    """Set up the argument parser for EC2 commands."""
+    """Set up the argument parser for EC2 commands and return it."""
     ec2_parser = subparsers.add_parser('ec2', help='EC2 operations')
     ec2_subparsers = ec2_parser.add_subparsers(dest='ec2_command', help='EC2 command')
     
@@ -142,23 +235,27 @@ def setup_ec2_parser(subparsers):
     create_instance_parser.add_argument('--key-name', help='Key pair name')
     create_instance_parser.add_argument('--region', help='AWS region')
     create_instance_parser.add_argument('--wait', action='store_true', default=True, help='Wait for instance to be running')
+    create_instance_parser.add_argument('--no-wait', dest='wait', action='store_false', help='Return without waiting for the instance to be running')
     
     # Start/stop/terminate commands
     start_instance_parser = ec2_subparsers.add_parser('start-instance', help='Start EC2 instance')
     start_instance_parser.add_argument('instance_id', help='Instance ID')
     start_instance_parser.add_argument('--region', help='AWS region')
     start_instance_parser.add_argument('--wait', action='store_true', default=True, help='Wait for instance to be running')
+    start_instance_parser.add_argument('--no-wait', dest='wait', action='store_false', help='Return without waiting for the instance to be running')
     
     stop_instance_parser = ec2_subparsers.add_parser('stop-instance', help='Stop EC2 instance')
     stop_instance_parser.add_argument('instance_id', help='Instance ID')
     stop_instance_parser.add_argument('--force', action='store_true', help='Force stop')
     stop_instance_parser.add_argument('--region', help='AWS region')
     stop_instance_parser.add_argument('--wait', action='store_true', default=True, help='Wait for instance to be stopped')
+    stop_instance_parser.add_argument('--no-wait', dest='wait', action='store_false', help='Return without waiting for the instance to be stopped')
     
     terminate_instance_parser = ec2_subparsers.add_parser('terminate-instance', help='Terminate EC2 instance')
     terminate_instance_parser.add_argument('instance_id', help='Instance ID')
     terminate_instance_parser.add_argument('--region', help='AWS region')
     terminate_instance_parser.add_argument('--wait', action='store_true', default=True, help='Wait for instance to be terminated')
+    terminate_instance_parser.add_argument('--no-wait', dest='wait', action='store_false', help='Return without waiting for the instance to be terminated')
     
     # Deploy from GitHub command
     deploy_parser = ec2_subparsers.add_parser('deploy-from-github', help='Deploy from GitHub to EC2')
@@ -168,10 +265,12 @@ def setup_ec2_parser(subparsers):
     deploy_parser.add_argument('--path', default='/var/www/html', help='Deployment path on instance')
     deploy_parser.add_argument('--setup-script', help='Setup script to run after deployment')
     deploy_parser.add_argument('--region', help='AWS region')
+    
+    return ec2_parser
 
 
 def setup_github_parser(subparsers):
-    """Set up the argument parser for GitHub commands."""
+    """Set up the argument parser for GitHub commands and return it."""
     github_parser = subparsers.add_parser('github', help='GitHub operations')
     github_subparsers = github_parser.add_subparsers(dest='github_command', help='GitHub command')
     
@@ -198,10 +297,12 @@ def setup_github_parser(subparsers):
     list_branches_parser.add_argument('repo', help='Repository name or full path (owner/repo)')
     list_branches_parser.add_argument('--owner', help='Repository owner')
     list_branches_parser.add_argument('--output', choices=['json', 'table'], default='table', help='Output format')
+    
+    return github_parser
 
 
 def setup_deploy_parser(subparsers):
-    """Set up the argument parser for deployment commands."""
+    """Set up the argument parser for deployment commands and return it."""
     deploy_parser = subparsers.add_parser('deploy', help='Deployment operations')
     deploy_subparsers = deploy_parser.add_subparsers(dest='deploy_command', help='Deployment command')
     
@@ -221,63 +322,156 @@ def setup_deploy_parser(subparsers):
     github_to_s3_parser.add_argument('--branch', default='main', help='GitHub branch')
     github_to_s3_parser.add_argument('--source-dir', help='Source directory in repository')
     github_to_s3_parser.add_argument('--region', help='AWS region')
+    
+    return deploy_parser
+
+
+# Command groups with their parser setup functions and help text
+COMMAND_GROUPS = {
+    'ec2': (setup_ec2_parser, 'EC2 operations'),
+    'github': (setup_github_parser, 'GitHub operations'),
+    'deploy': (setup_deploy_parser, 'Deployment operations')
+}
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """
+    Find the command group named on the command line.
+    
+    Args:
+        argv: Command line arguments, without the program name
+        
+    Returns:
+        The command group name, or None if no known group was given
+    """
+    for arg in argv:
+        if not arg.startswith('-'):
+            return arg if arg in COMMAND_GROUPS else None
+    return None
+
+
+# Use orjson for JSON output when it is installed
+try:
+    import orjson
+    
+    def _json_dumps(data, indent: bool = True) -> str:
+        """Serialize data to JSON, indented by two spaces unless indent is False."""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option, default=str).decode()
+except ImportError:
+    def _json_dumps(data, indent: bool = True) -> str:
+        """Serialize data to JSON, indented by two spaces unless indent is False."""
+        return json.dumps(data, indent=2 if indent else None, default=str)
+
+# Fields listed first in table output, in this order
+_PRIORITY_FIELDS = ('id', 'name', 'instanceId', 'InstanceId', 'state', 'State', 'type', 'Type')
+_PRIORITY_SET = frozenset(_PRIORITY_FIELDS)
+
+def _format_cell(value) -> str:
+    """Format a value for a table cell, truncated to 30 characters."""
+    if isinstance(value, dict) and 'Name' in value:
+        value = value['Name']
+    return str(value)[:30]
 
+def _format_table(headers, rows) -> str:
+    """
+    Format rows of values as a table.
+    
+    Args:
+        headers: Column names
+        rows: Rows of values, each in column order
+        
+    Returns:
+        The table text, ending with a newline
+    """
+    header = ' | '.join(headers)
+    lines = [header, '-' * (len(header) + 1)]
+    for row in rows:
+        lines.append(' | '.join([_format_cell(value) for value in row]))
+    return '\n'.join(lines) + '\n'
 
 def format_output(data, format_type='table'):
-    """Format output data based on format type."""
+    """Format output data based on format type, ending with a newline."""
     if format_type == 'json':
-        return json.dumps(data, indent=2, default=str)
+        return _json_dumps(data) + '\n'
     
     # Simple table format for common data structures
     if isinstance(data, list) and data and isinstance(data[0], dict):
-        # Get all unique keys
-        keys = set()
-        for item in data:
-            keys.update(item.keys())
+        # Get all unique keys in the order they are first seen
+        keys = dict.fromkeys([key for item in data for key in item])
         
         # Prioritize common fields
-        priority_fields = ['id', 'name', 'instanceId', 'InstanceId', 'state', 'State', 'type', 'Type']
-        ordered_keys = [k for k in priority_fields if k in keys]
-        ordered_keys.extend([k for k in keys if k not in ordered_keys])
-        
-        # Create table header
-        result = ' | '.join(ordered_keys) + '\n'
-        result += '-' * len(result) + '\n'
-        
-        # Add rows
-        for item in data:
-            row = []
-            for key in ordered_keys:
-                value = item.get(key, '')
-                if isinstance(value, dict) and 'Name' in value:
-                    value = value['Name']
-                row.append(str(value)[:30])
-            result += ' | '.join(row) + '\n'
-            
-        return result
+        ordered_keys = [k for k in _PRIORITY_FIELDS if k in keys]
+        ordered_keys += [k for k in keys if k not in _PRIORITY_SET]
+        
+        return _format_table(ordered_keys, [[item.get(key, '') for key in ordered_keys] for item in data])
     
     # For single dict objects
     elif isinstance(data, dict):
         result = ''
         for key, value in data.items():
             if isinstance(value, dict):
-                value = json.dumps(value, default=str)
+                value = _json_dumps(value, indent=False)
             result += f"{key}: {value}\n"
         return result
     
     # Default to string representation
-    return str(data)
+    return f"{data}\n"
+
+
+@functools.lru_cache(maxsize=4)
+def _get_ec2_service(region: Optional[str] = None):
+    """
+    Get an EC2 service for a region, reused for the lifetime of the process.
+    
+    Creating the service sets up a boto3 session and client, so when the CLI is
+    driven repeatedly from one process (a REPL or a test harness) the service
+    and the credentials it was created with are cached. Run with --no-cache to
+    pick up rotated credentials.
+    
+    Args:
+        region: AWS region, or None for the configured default
+        
+    Returns:
+        EC2 service for the region
+    """
+    from .aws.ec2 import EC2Service
+    
+    aws_creds = get_credential_manager().get_aws_credentials(region=region)
+    return EC2Service(credentials=aws_creds)
+
+@functools.lru_cache(maxsize=1)
+def _get_github_service():
+    """
+    Get a GitHub service, reused for the lifetime of the process.
+    
+    Returns:
+        GitHub service authenticated with the configured token
+    """
+    from .github.github import GitHubService
+    
+    github_creds = get_credential_manager().get_github_credentials()
+    return GitHubService(token=github_creds.token)
+
+def clear_service_cache() -> None:
+    """Drop the cached services so they are recreated with fresh credentials."""
+    _get_ec2_service.cache_clear()
+    _get_github_service.cache_clear()
+
 
+# Columns of the list-instances table, in the order format_output would use
+_INSTANCE_COLUMNS = ('InstanceId', 'State', 'Type', 'Name', 'LaunchTime')
+
+def _instance_name(instance: Dict[str, Any]) -> str:
+    """Get the Name tag of an EC2 instance, or 'unnamed' if it has none."""
+    return next((tag['Value'] for tag in instance.get('Tags', ()) if tag['Key'] == 'Name'), 'unnamed')
 
 def handle_ec2_command(args):
     """Handle EC2-related commands."""
-    # Get AWS credentials
+    from .aws.base import ResourceNotFoundError
+    
     try:
-        cred_manager = get_credential_manager()
-        aws_creds = cred_manager.get_aws_credentials(region=args.region)
-        
-        # Initialize EC2 service
-        ec2 = EC2Service(credentials=aws_creds)
+        # Get EC2 service
+        ec2 = _get_ec2_service(args.region)
         
         if args.ec2_command == 'list-instances':
             filters = []
@@ -289,32 +483,38 @@ def handle_ec2_command(args):
             
             instances = ec2.list_instances(filters=filters if filters else None)
             
-            # Simplify instance data for output
-            simplified_instances = []
-            for instance in instances:
-                name = 'unnamed'
-                for tag in instance.get('Tags', []):
-                    if tag['Key'] == 'Name':
-                        name = tag['Value']
-                        break
-                
-                simplified_instances.append({
-                    'InstanceId': instance['InstanceId'],
-                    'Name': name,
-                    'State': instance['State']['Name'],
-                    'Type': instance['InstanceType'],
-                    'LaunchTime': instance['LaunchTime']
-                })
-            
-            if not simplified_instances:
-                print(f"{COLORS['yellow']}No instances found.{COLORS['reset']}")
+            if not instances:
+                print(f"{_YELLOW}No instances found.{_RESET}")
+            elif args.output == 'table':
+                # Build table rows straight from the instances, without a dict per row
+                sys.stdout.write(_format_table(_INSTANCE_COLUMNS, [
+                    (
+                        instance['InstanceId'],
+                        instance['State']['Name'],
+                        instance['InstanceType'],
+                        _instance_name(instance),
+                        instance['LaunchTime']
+                    )
+                    for instance in instances
+                ]))
             else:
-                print(format_output(simplified_instances, args.output))
+                # Simplify instance data for output
+                simplified_instances = [
+                    {
+                        'InstanceId': instance['InstanceId'],
+                        'Name': _instance_name(instance),
+                        'State': instance['State']['Name'],
+                        'Type': instance['InstanceType'],
+                        'LaunchTime': instance['LaunchTime']
+                    }
+                    for instance in instances
+                ]
+                sys.stdout.write(format_output(simplified_instances, args.output))
             
         elif args.ec2_command == 'get-instance':
             try:
                 instance = ec2.get_instance(args.instance_id)
-                print(format_output(instance, args.output))
+                sys.stdout.write(format_output(instance, args.output))
             except ResourceNotFoundError:
                 print_error(
                     f"Instance {args.instance_id} not found",
@@ -336,24 +536,24 @@ def handle_ec2_command(args):
                     key_name=args.key_name,
                     wait=args.wait
                 )
-            print(f"{COLORS['green']}Created instance: {instance['InstanceId']}{COLORS['reset']}")
-            print(format_output(instance, 'json'))
+            print(f"{_GREEN}Created instance: {instance['InstanceId']}{_RESET}")
+            sys.stdout.write(format_output(instance, 'json'))
         
         elif args.ec2_command == 'start-instance':
             instance = ec2.start_instance(args.instance_id, wait=args.wait)
-            print(f"{COLORS['green']}Started instance: {instance['InstanceId']}{COLORS['reset']}")
+            print(f"{_GREEN}Started instance: {instance['InstanceId']}{_RESET}")
         
         elif args.ec2_command == 'stop-instance':
             instance = ec2.stop_instance(args.instance_id, force=args.force, wait=args.wait)
-            print(f"{COLORS['green']}Stopped instance: {instance['InstanceId']}{COLORS['reset']}")
+            print(f"{_GREEN}Stopped instance: {instance['InstanceId']}{_RESET}")
         
         elif args.ec2_command == 'terminate-instance':
             instance = ec2.terminate_instance(args.instance_id, wait=args.wait)
-            print(f"{COLORS['green']}Terminated instance: {instance['InstanceId']}{COLORS['reset']}")
+            print(f"{_GREEN}Terminated instance: {instance['InstanceId']}{_RESET}")
         
         elif args.ec2_command == 'deploy-from-github':
             # Get GitHub credentials
-            github_creds = cred_manager.get_github_credentials()
+            github_creds = get_credential_manager().get_github_credentials()
             
             result = ec2.deploy_from_github(
                     instance_id=args.instance_id,
@@ -366,15 +566,15 @@ def handle_ec2_command(args):
                 
             status = result.get('status', 'unknown')
             if status.lower() in ['success', 'succeeded']:
-                print(f"{COLORS['green']}Deployment status: {status}{COLORS['reset']}")
+                print(f"{_GREEN}Deployment status: {status}{_RESET}")
             else:
-                print(f"{COLORS['yellow']}Deployment status: {status}{COLORS['reset']}")
+                print(f"{_YELLOW}Deployment status: {status}{_RESET}")
                 
             if result.get('output'):
-                print(f"{COLORS['cyan']}Deployment output:{COLORS['reset']}")
+                print(f"{_CYAN}Deployment output:{_RESET}")
                 print(result['output'])
             if result.get('error'):
-                print(f"{COLORS['red']}Deployment error:{COLORS['reset']}")
+                print(f"{_RED}Deployment error:{_RESET}")
                 print(result['error'])
         
         return 0
@@ -386,20 +586,15 @@ def handle_ec2_command(args):
 def handle_github_command(args):
     """Handle GitHub-related commands."""
     try:
-        # Get GitHub credentials
-        cred_manager = get_credential_manager()
-        github_creds = cred_manager.get_github_credentials()
-        
-        # Initialize GitHub service
-        github = GitHubService(token=github_creds.token)
+        # Get GitHub service
+        github = _get_github_service()
         
         if args.github_command == 'list-repos':
             repos = github.list_repositories(org=args.org, user=args.user)
             
             # Simplify repo data for output
-            simplified_repos = []
-            for repo in repos:
-                simplified_repos.append({
+            simplified_repos = [
+                {
                     'Name': repo['name'],
                     'FullName': repo['full_name'],
                     'Description': repo.get('description', ''),
@@ -407,40 +602,43 @@ def handle_github_command(args):
                     'Stars': repo['stargazers_count'],
                     'Forks': repo['forks_count'],
                     'Language': repo.get('language', '')
-                })
+                }
+                for repo in repos
+            ]
             
             if not simplified_repos:
-                print(f"{COLORS['yellow']}No repositories found.{COLORS['reset']}")
+                print(f"{_YELLOW}No repositories found.{_RESET}")
             else:
-                print(format_output(simplified_repos, args.output))
+                sys.stdout.write(format_output(simplified_repos, args.output))
         
         elif args.github_command == 'get-repo':
             repo = github.get_repository(args.repo, owner=args.owner)
-            print(format_output(repo, args.output))
+            sys.stdout.write(format_output(repo, args.output))
         
         elif args.github_command == 'get-readme':
             readme = github.get_readme(args.repo, owner=args.owner, ref=args.ref)
             if 'decoded_content' in readme:
                 print(readme['decoded_content'])
             else:
-                print(format_output(readme, 'json'))
+                sys.stdout.write(format_output(readme, 'json'))
         
         elif args.github_command == 'list-branches':
             branches = github.list_branches(args.repo, owner=args.owner)
             
             # Simplify branch data for output
-            simplified_branches = []
-            for branch in branches:
-                simplified_branches.append({
+            simplified_branches = [
+                {
                     'Name': branch['name'],
                     'SHA': branch['commit']['sha'],
                     'Protected': branch.get('protected', False)
-                })
+                }
+                for branch in branches
+            ]
             
             if not simplified_branches:
-                print(f"{COLORS['yellow']}No branches found.{COLORS['reset']}")
+                print(f"{_YELLOW}No branches found.{_RESET}")
             else:
-                print(format_output(simplified_branches, args.output))
+                sys.stdout.write(format_output(simplified_branches, args.output))
         
         return 0
         
@@ -452,21 +650,18 @@ def handle_deploy_command(args):
     """Handle deployment commands."""
     try:
         if args.deploy_command == 'github-to-ec2':
-            # Get credentials
-            cred_manager = get_credential_manager()
-            aws_creds = cred_manager.get_aws_credentials(region=args.region)
-            github_creds = cred_manager.get_github_credentials()
+            # Get services
+            ec2 = _get_ec2_service(args.region)
+            github = _get_github_service()
             
-            # Initialize services
-            ec2 = EC2Service(credentials=aws_creds)
-            github = GitHubService(token=github_creds.token)
-            
-            # Verify GitHub repository exists
-            repo_info = github.get_repository(args.repo)
+            # Verify the GitHub repository and EC2 instance exist; the two
+            # lookups are independent, so they run concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                repo_future = executor.submit(github.get_repository, args.repo)
+                instance_future = executor.submit(ec2.get_instance, args.instance_id)
+                repo_info = repo_future.result()
+                instance = instance_future.result()
             logger.info(f"Deploying from repository: {repo_info['full_name']}")
-            
-            # Verify EC2 instance exists
-            instance = ec2.get_instance(args.instance_id)
             logger.info(f"Deploying to instance: {args.instance_id}")
             
             # Deploy from GitHub to EC2
@@ -476,20 +671,20 @@ def handle_deploy_command(args):
                 branch=args.branch,
                 deploy_path=args.path,
                 setup_script=args.setup_script,
-                github_token=github_creds.token
+                github_token=github.token
             )
             
             status = result.get('status', 'unknown')
             if status.lower() in ['success', 'succeeded']:
-                print(f"{COLORS['green']}Deployment status: {status}{COLORS['reset']}")
+                print(f"{_GREEN}Deployment status: {status}{_RESET}")
             else:
-                print(f"{COLORS['yellow']}Deployment status: {status}{COLORS['reset']}")
+                print(f"{_YELLOW}Deployment status: {status}{_RESET}")
                 
             if result.get('output'):
-                print(f"{COLORS['cyan']}Deployment output:{COLORS['reset']}")
+                print(f"{_CYAN}Deployment output:{_RESET}")
                 print(result['output'])
             if result.get('error'):
-                print(f"{COLORS['red']}Deployment error:{COLORS['reset']}")
+                print(f"{_RED}Deployment error:{_RESET}")
                 print(result['error'])
         
         elif args.deploy_command == 'github-to-s3':
@@ -507,24 +702,38 @@ def handle_deploy_command(args):
 
 def main():
     """Main entry point for the CLI."""
+    # Answer a bare version request without building any parsers
+    if sys.argv[1:] in (['--version'], ['-V']):
+        print(f"devops-agent {__version__}")
+        sys.exit(0)
+    
     try:
-        parser = argparse.ArgumentParser(description='DevOps Agent CLI')
+        parser = _ArgumentParser(description='DevOps Agent CLI')
         parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+        parser.add_argument('--no-cache', action='store_true', help='Recreate cached AWS and GitHub clients with fresh credentials')
+        parser.add_argument('-V', '--version', action='version', version=f"devops-agent {__version__}")
         
         # Create subparsers for different command groups
         subparsers = parser.add_subparsers(dest='command', help='Command group')
         
-        # Set up command parsers
-        setup_ec2_parser(subparsers)
-        setup_github_parser(subparsers)
-        setup_deploy_parser(subparsers)
+        # Set up the full parser only for the command group being run; the
+        # others get a stub so they still show up in the top-level help
+        command = _sniff_subcommand(sys.argv[1:])
+        group_parsers = {}
+        for name, (setup_parser, help_text) in COMMAND_GROUPS.items():
+            if name == command:
+                group_parsers[name] = setup_parser(subparsers)
+            else:
+                group_parsers[name] = subparsers.add_parser(name, help=help_text)
         
         # Parse arguments
         args = parser.parse_args()
         
         # Set up logging
-        if args.debug:
-            logging.getLogger().setLevel(logging.DEBUG)
+        _configure_logging(args.debug)
+        
+        if args.no_cache:
+            clear_service_cache()
         
         # Exit if no command specified
         if not args.command:
@@ -534,19 +743,19 @@ def main():
         # Handle commands
         if args.command == 'ec2':
             if not args.ec2_command:
-                parser.parse_args(['ec2', '--help'])
+                group_parsers['ec2'].print_help()
                 sys.exit(1)
             sys.exit(handle_ec2_command(args))
         
         elif args.command == 'github':
             if not args.github_command:
-                parser.parse_args(['github', '--help'])
+                group_parsers['github'].print_help()
                 sys.exit(1)
             sys.exit(handle_github_command(args))
         
         elif args.command == 'deploy':
             if not args.deploy_command:
-                parser.parse_args(['deploy', '--help'])
+                group_parsers['deploy'].print_help()
                 sys.exit(1)
             sys.exit(handle_deploy_command(args))
         
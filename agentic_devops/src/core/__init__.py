@@ -24,12 +24,32 @@ from .context import (
     DevOpsContext
 )
 
-from .guardrails import (
-    security_guardrail,
-    sensitive_info_guardrail,
-    SecurityCheckOutput,
-    SensitiveInfoOutput
-)
+import importlib
+from typing import Any, List
+
+# The guardrails import the Agents SDK, so they are only imported on first use;
+# the CLI needs config and credentials without paying for it.
+_LAZY_IMPORTS = {
+    'security_guardrail': 'guardrails',
+    'sensitive_info_guardrail': 'guardrails',
+    'SecurityCheckOutput': 'guardrails',
+    'SensitiveInfoOutput': 'guardrails'
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported name from its module on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Config
@@ -49,8 +69,5 @@ __all__ = [
     'DevOpsContext',
     
     # Guardrails
-    'security_guardrail',
-    'sensitive_info_guardrail',
-    'SecurityCheckOutput',
-    'SensitiveInfoOutput'
+    *_LAZY_IMPORTS
 ]
\ No newline at end of file
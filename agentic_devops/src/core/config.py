@@ -32,7 +32,8 @@ DEFAULT_CONFIG = {
     },
     "github": {
         "organization": None,
-        "api_url": "https://api.github.com"
+        "api_url": "https://api.github.com",
+        "verify_access": False
     },
     "logging": {
         "level": "INFO",
@@ -6,18 +6,94 @@ and managing AWS, GitHub, and other service credentials.
 """
 
 import os
-import json
 import logging
+import threading
 from typing import Dict, Optional, Any
 from pathlib import Path
-import boto3
-from botocore.exceptions import ProfileNotFound
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Use orjson to parse the credentials file when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Environment variables read by the credential manager
+_ENV_KEYS = (
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+    "AWS_REGION",
+    "AWS_DEFAULT_REGION",
+    "AWS_PROFILE",
+    "GITHUB_TOKEN",
+    "GITHUB_API_URL",
+)
+
+# Snapshot of the environment, filled at import; env vars don't change after startup
+_ENV_SNAPSHOT: Dict[str, Optional[str]] = {}
+
+# Defaults resolved from the snapshot
+_DEFAULT_REGION = "us-west-2"
+_GITHUB_API_URL_DEFAULT = "https://api.github.com"
+
+
+def refresh_env_snapshot() -> None:
+    """
+    Re-read the credential environment variables into the snapshot.
+    
+    Only needed when the environment is changed at runtime, e.g. in tests.
+    Credentials that were already loaded are not reloaded.
+    """
+    global _DEFAULT_REGION, _GITHUB_API_URL_DEFAULT
+    _ENV_SNAPSHOT.update((key, os.environ.get(key)) for key in _ENV_KEYS)
+    _DEFAULT_REGION = _ENV_SNAPSHOT["AWS_REGION"] or _ENV_SNAPSHOT["AWS_DEFAULT_REGION"] or "us-west-2"
+    _GITHUB_API_URL_DEFAULT = _ENV_SNAPSHOT["GITHUB_API_URL"] or "https://api.github.com"
+
+
+refresh_env_snapshot()
+
+
+# Read buffer large enough for the credentials file to arrive in one read
+_CRED_FILE_BUFSIZE = 64 * 1024
+
+# Parsed credentials file, keyed by path, mtime and size
+_cred_file_cache: Dict[str, Any] = {"path": None, "mtime": None, "size": None, "data": None}
+
+
+def _read_credentials_file(path: str) -> Dict[str, Any]:
+    """
+    Read and parse a credentials file, reusing the last parse if it is unchanged.
+    
+    The file is stat'ed before it is read, so a file replaced during the read
+    is parsed again on the next call.
+    
+    Args:
+        path: Path to the credentials JSON file
+        
+    Returns:
+        Parsed credentials data
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = os.stat(path)
+    cache = _cred_file_cache
+    if (cache["path"] == path and cache["mtime"] == st.st_mtime_ns
+            and cache["size"] == st.st_size):
+        return cache["data"]
+    
+    with open(path, 'rb', buffering=_CRED_FILE_BUFSIZE) as f:
+        data = _json_loads(f.read())
+    
+    cache.update(path=path, mtime=st.st_mtime_ns, size=st.st_size, data=data)
+    return data
+
+
 # Custom exceptions
 class CredentialError(Exception):
     """Exception raised for credential-related errors."""
@@ -29,6 +105,8 @@ class CredentialError(Exception):
 # Credential models
 class AWSCredentials(BaseModel):
     """AWS credentials model."""
+    model_config = ConfigDict(frozen=True)
+    
     access_key_id: Optional[str] = Field(None, description="AWS Access Key ID")
     secret_access_key: Optional[str] = Field(None, description="AWS Secret Access Key")
     session_token: Optional[str] = Field(None, description="AWS Session Token")
@@ -38,6 +116,8 @@ class AWSCredentials(BaseModel):
 
 class GitHubCredentials(BaseModel):
     """GitHub credentials model."""
+    model_config = ConfigDict(frozen=True)
+    
     token: str = Field(..., description="GitHub Personal Access Token")
     api_url: str = Field("https://api.github.com", description="GitHub API URL")
 
@@ -51,31 +131,56 @@ class CredentialManager:
         """Initialize the credential manager."""
         self._aws_credentials: Optional[AWSCredentials] = None
         self._github_credentials: Optional[GitHubCredentials] = None
+        # Credentials loaded for explicitly requested profiles, by profile name
+        self._profile_credentials: Dict[str, AWSCredentials] = {}
+        # Serializes the first load so concurrent callers don't each load credentials
+        self._load_lock = threading.Lock()
     
-    def get_aws_credentials(self, region: Optional[str] = None) -> AWSCredentials:
+    def get_aws_credentials(
+        self,
+        region: Optional[str] = None,
+        profile_name: Optional[str] = None
+    ) -> AWSCredentials:
         """
         Get AWS credentials.
         
         Args:
             region: AWS region to use (overrides default)
+            profile_name: AWS profile to load credentials from. If None, credentials
+                          come from the environment or the default profile.
             
         Returns:
-            AWSCredentials object
+            AWSCredentials object. Without a region override this is the shared
+            cached instance, which is frozen.
             
         Raises:
             CredentialError: If AWS credentials cannot be loaded
         """
-        if self._aws_credentials is None:
-            self._load_aws_credentials()
+        if profile_name:
+            credentials = self._profile_credentials.get(profile_name)
+            if credentials is None:
+                with self._load_lock:
+                    credentials = self._profile_credentials.get(profile_name)
+                    if credentials is None:
+                        credentials = _load_profile_credentials(profile_name)
+                        if credentials is None:
+                            raise CredentialError(
+                                f"No AWS credentials found for profile: {profile_name}",
+                                "Check the profile in ~/.aws/credentials or ~/.aws/config"
+                            )
+                        self._profile_credentials[profile_name] = credentials
+        else:
+            if self._aws_credentials is None:
+                with self._load_lock:
+                    if self._aws_credentials is None:
+                        self._load_aws_credentials()
+            credentials = self._aws_credentials
         
-        # Create a copy of the credentials
-        credentials = AWSCredentials(**self._aws_credentials.dict())
+        if not region:
+            return credentials
         
-        # Override region if provided
-        if region:
-            credentials.region = region
-        
-        return credentials
+        # Copy without re-validating to override the region
+        return credentials.model_copy(update={"region": region})
     
     def get_github_credentials(self) -> GitHubCredentials:
         """
@@ -88,7 +193,9 @@ class CredentialManager:
             CredentialError: If GitHub credentials cannot be loaded
         """
         if self._github_credentials is None:
-            self._load_github_credentials()
+            with self._load_lock:
+                if self._github_credentials is None:
+                    self._load_github_credentials()
         
         return self._github_credentials
     
@@ -99,44 +206,36 @@ class CredentialManager:
         Raises:
             CredentialError: If AWS credentials cannot be loaded
         """
+        # Values come from the environment or botocore and are already strings,
+        # so the models below are built with model_construct to skip validation
+        
         # Try to load from environment variables first
-        access_key_id = os.environ.get('AWS_ACCESS_KEY_ID')
-        secret_access_key = os.environ.get('AWS_SECRET_ACCESS_KEY')
-        session_token = os.environ.get('AWS_SESSION_TOKEN')
-        region = os.environ.get('AWS_REGION') or os.environ.get('AWS_DEFAULT_REGION', 'us-west-2')
-        profile = os.environ.get('AWS_PROFILE')
+        access_key_id = _ENV_SNAPSHOT['AWS_ACCESS_KEY_ID']
+        secret_access_key = _ENV_SNAPSHOT['AWS_SECRET_ACCESS_KEY']
+        session_token = _ENV_SNAPSHOT['AWS_SESSION_TOKEN']
+        profile = _ENV_SNAPSHOT['AWS_PROFILE']
         
         # If access key and secret key are provided, use them
         if access_key_id and secret_access_key:
-            self._aws_credentials = AWSCredentials(
+            self._aws_credentials = AWSCredentials.model_construct(
                 access_key_id=access_key_id,
                 secret_access_key=secret_access_key,
                 session_token=session_token,
-                region=region,
+                region=_DEFAULT_REGION,
                 profile=profile
             )
             logger.info("AWS credentials loaded from environment variables")
             return
         
+        # boto3 is slow to import, so only load it when the environment has no keys
+        import boto3
+        
         # If profile is provided, try to load from AWS config
         if profile:
-            try:
-                # Create a session with the profile
-                session = boto3.Session(profile_name=profile)
-                credentials = session.get_credentials()
-                
-                if credentials:
-                    self._aws_credentials = AWSCredentials(
-                        access_key_id=credentials.access_key,
-                        secret_access_key=credentials.secret_key,
-                        session_token=credentials.token,
-                        region=session.region_name or region,
-                        profile=profile
-                    )
-                    logger.info(f"AWS credentials loaded from profile: {profile}")
-                    return
-            except ProfileNotFound:
-                logger.warning(f"AWS profile not found: {profile}")
+            credentials = _load_profile_credentials(profile)
+            if credentials is not None:
+                self._aws_credentials = credentials
+                return
         
         # Try to load from default profile
         try:
@@ -145,11 +244,11 @@ class CredentialManager:
             credentials = session.get_credentials()
             
             if credentials:
-                self._aws_credentials = AWSCredentials(
+                self._aws_credentials = AWSCredentials.model_construct(
                     access_key_id=credentials.access_key,
                     secret_access_key=credentials.secret_key,
                     session_token=credentials.token,
-                    region=session.region_name or region,
+                    region=session.region_name or _DEFAULT_REGION,
                     profile=None
                 )
                 logger.info("AWS credentials loaded from default profile")
@@ -159,7 +258,7 @@ class CredentialManager:
         
         # If we get here, we couldn't load credentials
         logger.warning("No AWS credentials found, using empty credentials")
-        self._aws_credentials = AWSCredentials(region=region)
+        self._aws_credentials = AWSCredentials.model_construct(region=_DEFAULT_REGION)
     
     def _load_github_credentials(self) -> None:
         """
@@ -169,21 +268,20 @@ class CredentialManager:
             CredentialError: If GitHub credentials cannot be loaded
         """
         # Try to load from environment variables
-        token = os.environ.get('GITHUB_TOKEN')
-        api_url = os.environ.get('GITHUB_API_URL', 'https://api.github.com')
+        token = _ENV_SNAPSHOT['GITHUB_TOKEN']
         
         if not token:
             # Try to load from credentials file
             credentials_file = os.path.expanduser('~/.devops/credentials.json')
-            if os.path.exists(credentials_file):
-                try:
-                    with open(credentials_file, 'r') as f:
-                        credentials = json.load(f)
-                        if 'github' in credentials and 'token' in credentials['github']:
-                            token = credentials['github']['token']
-                            logger.info("GitHub credentials loaded from credentials file")
-                except Exception as e:
-                    logger.warning(f"Failed to load GitHub credentials from file: {e}")
+            try:
+                credentials = _read_credentials_file(credentials_file)
+                if 'github' in credentials and 'token' in credentials['github']:
+                    token = credentials['github']['token']
+                    logger.info("GitHub credentials loaded from credentials file")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to load GitHub credentials from file: {e}")
         
         if not token:
             raise CredentialError(
@@ -193,13 +291,50 @@ class CredentialManager:
         
         self._github_credentials = GitHubCredentials(
             token=token,
-            api_url=api_url
+            api_url=_GITHUB_API_URL_DEFAULT
         )
         logger.info("GitHub credentials loaded")
 
 
-# Global credential manager instance
+def _load_profile_credentials(profile: str) -> Optional[AWSCredentials]:
+    """
+    Load AWS credentials from a profile in the AWS config.
+    
+    Args:
+        profile: AWS profile name
+        
+    Returns:
+        AWSCredentials object, or None if the profile is missing or has no credentials
+    """
+    # boto3 is slow to import, so only load it when a profile is used
+    import boto3
+    from botocore.exceptions import ProfileNotFound
+    
+    try:
+        # Create a session with the profile
+        session = boto3.Session(profile_name=profile)
+        credentials = session.get_credentials()
+    except ProfileNotFound:
+        logger.warning(f"AWS profile not found: {profile}")
+        return None
+    
+    if not credentials:
+        return None
+    
+    logger.info(f"AWS credentials loaded from profile: {profile}")
+    return AWSCredentials.model_construct(
+        access_key_id=credentials.access_key,
+        secret_access_key=credentials.secret_key,
+        session_token=credentials.token,
+        region=session.region_name or _DEFAULT_REGION,
+        profile=profile
+    )
+
+
+# Global credential manager instance, created on first use
 _credential_manager: Optional[CredentialManager] = None
+# Makes concurrent first callers share one manager (and so one load lock)
+_credential_manager_lock = threading.Lock()
 
 
 def get_credential_manager() -> CredentialManager:
@@ -212,7 +347,9 @@ def get_credential_manager() -> CredentialManager:
     global _credential_manager
     
     if _credential_manager is None:
-        _credential_manager = CredentialManager()
+        with _credential_manager_lock:
+            if _credential_manager is None:
+                _credential_manager = CredentialManager()
     
     return _credential_manager
 
@@ -225,4 +362,5 @@ def set_credential_manager(manager: CredentialManager) -> None:
         manager: CredentialManager instance to use
     """
     global _credential_manager
-    _credential_manager = manager
\ No newline at end of file
+    with _credential_manager_lock:
+        _credential_manager = manager
@@ -5,14 +5,21 @@ This module implements guardrails to prevent potentially harmful operations,
 detect sensitive information, and ensure secure agent behavior.
 """
 
+import os
 import re
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from pydantic import BaseModel, Field
 
 from agents import Agent, Runner, GuardrailFunctionOutput, RunContextWrapper
 from agents import input_guardrail, output_guardrail
 
+try:
+    import hyperscan
+except ImportError:  # pragma: no cover - optional dependency
+    hyperscan = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -37,6 +44,297 @@ class SensitiveInfoOutput(BaseModel):
     )
 
 
+# Patterns shared by the security and sensitive information checks
+_GITHUB_TOKEN_PATTERN = r"ghp_[a-zA-Z0-9]{36}"
+_PRIVATE_KEY_PATTERN = r"-----BEGIN\s+(RSA|DSA|EC|OPENSSH)\s+PRIVATE\s+KEY-----"
+
+# Patterns for potentially dangerous commands
+DANGEROUS_PATTERNS = [
+    r"rm\s+-rf\s+[/~]",  # Remove root or home directory
+    r"dd\s+if=/dev/zero\s+of=/dev/[hs]d[a-z]",  # Disk wipe
+    r":(){ :\|:& };:",  # Fork bomb
+    r"wget\s+.+\s+\|\s+bash",  # Download and execute
+    r"curl\s+.+\s+\|\s+bash",  # Download and execute
+    r"sudo\s+rm\s+-rf\s+--no-preserve-root\s+/",  # Remove root with no preserve
+    r"mkfs\s+/dev/[hs]d[a-z]",  # Format disk
+    r"DROP\s+TABLE",  # SQL injection
+    r"DELETE\s+FROM\s+.+\s+WHERE",  # SQL deletion
+    r"shutdown\s+-h\s+now",  # Shutdown system
+    r"halt",  # Halt system
+    r"poweroff",  # Power off system
+    r"sudo\s+passwd\s+root",  # Change root password
+    r"chmod\s+-R\s+777\s+/",  # Change permissions on root
+    r"chown\s+-R\s+[^:]+:[^:]+\s+/",  # Change ownership on root
+]
+
+# Security checks as (pattern, reasoning, ignore case)
+SECURITY_CHECKS = [
+    *[
+        (pattern, f"Input contains potentially dangerous command pattern: {pattern}", True)
+        for pattern in DANGEROUS_PATTERNS
+    ],
+    (
+        r"(AWS_ACCESS_KEY_ID|AWS_SECRET_ACCESS_KEY|aws_access_key_id|aws_secret_access_key)",
+        "Input contains AWS credential information",
+        False
+    ),
+    (
+        rf"(github_token|GITHUB_TOKEN|{_GITHUB_TOKEN_PATTERN})",
+        "Input contains GitHub token information",
+        False
+    ),
+    (
+        _PRIVATE_KEY_PATTERN,
+        "Input contains private key information",
+        False
+    ),
+]
+
+# Patterns for sensitive information
+SENSITIVE_PATTERNS = [
+    # AWS credentials
+    r"(AKIA[0-9A-Z]{16})",  # AWS Access Key ID
+    r"aws_secret_access_key[\"'\s:=]+([0-9a-zA-Z/+]{40})",  # AWS Secret Access Key
+    
+    # GitHub tokens
+    r"(github_pat_[a-zA-Z0-9_]{22,})",  # GitHub Personal Access Token
+    rf"({_GITHUB_TOKEN_PATTERN})",  # GitHub Token
+    
+    # Private keys
+    _PRIVATE_KEY_PATTERN,
+    
+    # IP addresses (internal)
+    r"\b(10\.\d{1,3}\.\d{1,3}\.\d{1,3})\b",
+    r"\b(172\.(1[6-9]|2[0-9]|3[0-1])\.\d{1,3}\.\d{1,3})\b",
+    r"\b(192\.168\.\d{1,3}\.\d{1,3})\b",
+    
+    # Passwords
+    r"(password|passwd|pwd)[\s:=]+[^\s]+",
+    
+    # API keys
+    r"(api[_-]?key|apikey)[\s:=]+[^\s]+",
+    
+    # Database connection strings
+    r"(jdbc:|\bdb_connection|\bconnection_string)",
+]
+
+# Sensitive information checks as (pattern, reasoning, ignore case)
+SENSITIVE_CHECKS = [
+    (pattern, f"Output contains sensitive information matching pattern: {pattern}", True)
+    for pattern in SENSITIVE_PATTERNS
+]
+
+
+# Shortest text any security / sensitive pattern can match ("halt" / "pwd=x")
+_MIN_SECURITY_MATCH_LEN = 4
+_MIN_SENSITIVE_MATCH_LEN = 5
+
+# Text at least this long is scanned in a worker thread so a long scan does not
+# block the event loop; shorter text is scanned inline
+_DEFAULT_THREAD_SCAN_THRESHOLD = 64 * 1024
+
+
+def _thread_scan_threshold() -> int:
+    """
+    Get the thread scan threshold from DEVOPS_GUARDRAIL_THREAD_THRESHOLD.
+    
+    Returns:
+        Threshold in characters, or the default if the variable is unset or malformed
+    """
+    value = os.environ.get("DEVOPS_GUARDRAIL_THREAD_THRESHOLD")
+    if value is None:
+        return _DEFAULT_THREAD_SCAN_THRESHOLD
+    try:
+        return int(value)
+    except ValueError:
+        logger.debug(f"Ignoring malformed DEVOPS_GUARDRAIL_THREAD_THRESHOLD: {value!r}")
+        return _DEFAULT_THREAD_SCAN_THRESHOLD
+
+
+_THREAD_SCAN_THRESHOLD = _thread_scan_threshold()
+
+# Literal text (casefolded) that every sensitive pattern needs in order to match;
+# output containing none of these can skip the regex scan
+_SENSITIVE_LITERALS = (
+    "akia",
+    "aws_secret_access_key",
+    "github_pat_",
+    "ghp_",
+    "-----begin",
+    "10.",
+    "172.",
+    "192.168.",
+    "pass",
+    "pwd",
+    "api",
+    "jdbc:",
+    "db_connection",
+    "connection_string",
+)
+
+
+def _combine_checks(checks: List[Tuple[str, str, bool]]) -> Tuple[re.Pattern, Dict[str, str]]:
+    """
+    Combine checks into a single regex so text is scanned once per guardrail.
+    
+    Each pattern becomes a named alternative; patterns that are not case
+    insensitive are scoped with an inline flag so they keep matching case.
+    
+    Args:
+        checks: List of (pattern, reasoning, ignore case) tuples
+        
+    Returns:
+        Tuple of the compiled regex and a mapping from group name to reasoning
+    """
+    alternatives = []
+    reasons = {}
+    for index, (pattern, reasoning, ignore_case) in enumerate(checks):
+        name = f"check{index}"
+        if not ignore_case:
+            pattern = f"(?-i:{pattern})"
+        alternatives.append(f"(?P<{name}>{pattern})")
+        reasons[name] = reasoning
+    return re.compile("|".join(alternatives), re.IGNORECASE), reasons
+
+
+def _compile_hyperscan(checks: List[Tuple[str, str, bool]]) -> Optional[Any]:
+    """
+    Compile checks into a Hyperscan database when hyperscan is installed.
+    
+    Args:
+        checks: List of (pattern, reasoning, ignore case) tuples
+        
+    Returns:
+        Compiled hyperscan.Database, or None if hyperscan is unavailable or
+        rejects one of the patterns
+    """
+    if hyperscan is None:
+        return None
+    
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[pattern.encode() for pattern, _, _ in checks],
+            ids=list(range(len(checks))),
+            flags=[
+                hyperscan.HS_FLAG_SINGLEMATCH | (hyperscan.HS_FLAG_CASELESS if ignore_case else 0)
+                for _, _, ignore_case in checks
+            ]
+        )
+    except hyperscan.error as e:
+        logger.debug(f"Falling back to re for guardrail checks: {e}")
+        return None
+    return database
+
+
+def _scan(
+    text: str,
+    checks: List[Tuple[str, str, bool]],
+    database: Optional[Any],
+    regex: re.Pattern,
+    reasons: Dict[str, str]
+) -> Optional[str]:
+    """
+    Scan text against a set of checks and return the first matching reasoning.
+    
+    Args:
+        text: The text to scan
+        checks: List of (pattern, reasoning, ignore case) tuples
+        database: Hyperscan database for the checks, or None
+        regex: Combined regex used when no Hyperscan database is available
+        reasons: Mapping from combined regex group name to reasoning
+        
+    Returns:
+        Reasoning of the matching check, or None if nothing matched
+    """
+    if database is None:
+        match = regex.search(text)
+        return reasons[match.lastgroup] if match else None
+    
+    matched = []
+    
+    def on_match(pattern_id, start, end, flags, context):
+        matched.append(pattern_id)
+        # Returning True stops the scan at the first match
+        return True
+    
+    try:
+        database.scan(text.encode(), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    return checks[matched[0]][1] if matched else None
+
+
+def _scan_batch(
+    texts: List[str],
+    checks: List[Tuple[str, str, bool]],
+    database: Optional[Any],
+    regex: re.Pattern,
+    reasons: Dict[str, str]
+) -> List[Optional[str]]:
+    """
+    Scan several texts against a set of checks with one shared match handler.
+    
+    Each text is scanned on its own, so a match never spans two texts.
+    
+    Args:
+        texts: The texts to scan
+        checks: List of (pattern, reasoning, ignore case) tuples
+        database: Hyperscan database for the checks, or None
+        regex: Combined regex used when no Hyperscan database is available
+        reasons: Mapping from combined regex group name to reasoning
+        
+    Returns:
+        Reasoning of the matching check for each text, or None where nothing matched
+    """
+    if database is None:
+        search = regex.search
+        results = []
+        for text in texts:
+            match = search(text)
+            results.append(reasons[match.lastgroup] if match else None)
+        return results
+    
+    results = [None] * len(texts)
+    current = 0
+    
+    def on_match(pattern_id, start, end, flags, context):
+        results[current] = checks[pattern_id][1]
+        # Returning True stops the scan at the first match
+        return True
+    
+    scan = database.scan
+    for current, text in enumerate(texts):
+        try:
+            scan(text.encode(), match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass
+    return results
+
+
+def _may_contain_sensitive_info(text: str) -> bool:
+    """
+    Cheaply rule out text that no sensitive pattern can match.
+    
+    Args:
+        text: The text to check
+        
+    Returns:
+        False if the text is too short or contains none of the patterns'
+        literal text, True otherwise
+    """
+    if len(text) < _MIN_SENSITIVE_MATCH_LEN:
+        return False
+    folded = text.casefold()
+    return any(literal in folded for literal in _SENSITIVE_LITERALS)
+
+
+_SECURITY_RE, _SECURITY_REASONS = _combine_checks(SECURITY_CHECKS)
+_SENSITIVE_RE, _SENSITIVE_REASONS = _combine_checks(SENSITIVE_CHECKS)
+_SECURITY_DB = _compile_hyperscan(SECURITY_CHECKS)
+_SENSITIVE_DB = _compile_hyperscan(SENSITIVE_CHECKS)
+
+
 def check_security(input_text: str) -> SecurityCheckOutput:
     """
     Check if input text contains potentially malicious content.
@@ -47,54 +345,16 @@ def check_security(input_text: str) -> SecurityCheckOutput:
     Returns:
         SecurityCheckOutput with the check result
     """
-    # List of potentially dangerous patterns
-    dangerous_patterns = [
-        r"rm\s+-rf\s+[/~]",  # Remove root or home directory
-        r"dd\s+if=/dev/zero\s+of=/dev/[hs]d[a-z]",  # Disk wipe
-        r":(){ :\|:& };:",  # Fork bomb
-        r"wget\s+.+\s+\|\s+bash",  # Download and execute
-        r"curl\s+.+\s+\|\s+bash",  # Download and execute
-        r"sudo\s+rm\s+-rf\s+--no-preserve-root\s+/",  # Remove root with no preserve
-        r"mkfs\s+/dev/[hs]d[a-z]",  # Format disk
-        r"DROP\s+TABLE",  # SQL injection
-        r"DELETE\s+FROM\s+.+\s+WHERE",  # SQL deletion
-        r"shutdown\s+-h\s+now",  # Shutdown system
-        r"halt",  # Halt system
-        r"poweroff",  # Power off system
-        r"sudo\s+passwd\s+root",  # Change root password
-        r"chmod\s+-R\s+777\s+/",  # Change permissions on root
-        r"chown\s+-R\s+[^:]+:[^:]+\s+/",  # Change ownership on root
-    ]
-    
-    # Check for dangerous patterns
-    for pattern in dangerous_patterns:
-        if re.search(pattern, input_text, re.IGNORECASE):
+    # Check for dangerous patterns and credentials in a single scan, skipped
+    # for text too short or blank to match any pattern
+    if len(input_text) >= _MIN_SECURITY_MATCH_LEN and not input_text.isspace():
+        reasoning = _scan(input_text, SECURITY_CHECKS, _SECURITY_DB, _SECURITY_RE, _SECURITY_REASONS)
+        if reasoning:
             return SecurityCheckOutput(
                 is_malicious=True,
-                reasoning=f"Input contains potentially dangerous command pattern: {pattern}"
+                reasoning=reasoning
             )
     
-    # Check for AWS credentials
-    if re.search(r"(AWS_ACCESS_KEY_ID|AWS_SECRET_ACCESS_KEY|aws_access_key_id|aws_secret_access_key)", input_text):
-        return SecurityCheckOutput(
-            is_malicious=True,
-            reasoning="Input contains AWS credential information"
-        )
-    
-    # Check for GitHub tokens
-    if re.search(r"(github_token|GITHUB_TOKEN|ghp_[a-zA-Z0-9]{36})", input_text):
-        return SecurityCheckOutput(
-            is_malicious=True,
-            reasoning="Input contains GitHub token information"
-        )
-    
-    # Check for private keys
-    if re.search(r"-----BEGIN\s+(RSA|DSA|EC|OPENSSH)\s+PRIVATE\s+KEY-----", input_text):
-        return SecurityCheckOutput(
-            is_malicious=True,
-            reasoning="Input contains private key information"
-        )
-    
     # If no dangerous patterns found, return safe
     return SecurityCheckOutput(
         is_malicious=False,
@@ -112,41 +372,13 @@ def check_sensitive_info(output_text: str) -> SensitiveInfoOutput:
     Returns:
         SensitiveInfoOutput with the check result
     """
-    # Patterns for sensitive information
-    sensitive_patterns = [
-        # AWS credentials
-        r"(AKIA[0-9A-Z]{16})",  # AWS Access Key ID
-        r"([0-9a-zA-Z/+]{40})",  # AWS Secret Access Key
-        
-        # GitHub tokens
-        r"(github_pat_[a-zA-Z0-9_]{22,})",  # GitHub Personal Access Token
-        r"(ghp_[a-zA-Z0-9]{36})",  # GitHub Token
-        
-        # Private keys
-        r"-----BEGIN\s+(RSA|DSA|EC|OPENSSH)\s+PRIVATE\s+KEY-----",
-        
-        # IP addresses (internal)
-        r"(10\.\d{1,3}\.\d{1,3}\.\d{1,3})",
-        r"(172\.(1[6-9]|2[0-9]|3[0-1])\.\d{1,3}\.\d{1,3})",
-        r"(192\.168\.\d{1,3}\.\d{1,3})",
-        
-        # Passwords
-        r"(password|passwd|pwd)[\s:=]+[^\s]+",
-        
-        # API keys
-        r"(api[_-]?key|apikey)[\s:=]+[^\s]+",
-        
-        # Database connection strings
-        r"(jdbc:|\bdb_connection|\bconnection_string)",
-    ]
-    
-    # Check for sensitive patterns
-    for pattern in sensitive_patterns:
-        match = re.search(pattern, output_text, re.IGNORECASE)
-        if match:
+    # Check for sensitive patterns in a single scan, skipped when no pattern can match
+    if _may_contain_sensitive_info(output_text):
+        reasoning = _scan(output_text, SENSITIVE_CHECKS, _SENSITIVE_DB, _SENSITIVE_RE, _SENSITIVE_REASONS)
+        if reasoning:
             return SensitiveInfoOutput(
                 contains_sensitive_info=True,
-                reasoning=f"Output contains sensitive information matching pattern: {pattern}"
+                reasoning=reasoning
             )
     
     # If no sensitive patterns found, return safe
@@ -156,6 +388,59 @@ def check_sensitive_info(output_text: str) -> SensitiveInfoOutput:
     )
 
 
+def check_security_batch(input_texts: List[str]) -> List[SecurityCheckOutput]:
+    """
+    Check a batch of input texts for potentially malicious content.
+    
+    Args:
+        input_texts: The texts to check
+        
+    Returns:
+        List of SecurityCheckOutput, one per text in the same order
+    """
+    reasonings = _scan_batch(input_texts, SECURITY_CHECKS, _SECURITY_DB, _SECURITY_RE, _SECURITY_REASONS)
+    return [
+        SecurityCheckOutput(is_malicious=True, reasoning=reasoning)
+        if reasoning else
+        SecurityCheckOutput(
+            is_malicious=False,
+            reasoning="Input does not contain any known dangerous patterns"
+        )
+        for reasoning in reasonings
+    ]
+
+
+def check_sensitive_info_batch(output_texts: List[str]) -> List[SensitiveInfoOutput]:
+    """
+    Check a batch of output texts for sensitive information.
+    
+    Args:
+        output_texts: The texts to check
+        
+    Returns:
+        List of SensitiveInfoOutput, one per text in the same order
+    """
+    # Only scan texts that some pattern could match
+    candidates = [index for index, text in enumerate(output_texts) if _may_contain_sensitive_info(text)]
+    reasonings = [None] * len(output_texts)
+    scanned = _scan_batch(
+        [output_texts[index] for index in candidates],
+        SENSITIVE_CHECKS, _SENSITIVE_DB, _SENSITIVE_RE, _SENSITIVE_REASONS
+    )
+    for index, reasoning in zip(candidates, scanned):
+        reasonings[index] = reasoning
+    
+    return [
+        SensitiveInfoOutput(contains_sensitive_info=True, reasoning=reasoning)
+        if reasoning else
+        SensitiveInfoOutput(
+            contains_sensitive_info=False,
+            reasoning="Output does not contain any known sensitive information patterns"
+        )
+        for reasoning in reasonings
+    ]
+
+
 @input_guardrail
 async def security_guardrail(
     ctx: RunContextWrapper,
@@ -173,16 +458,21 @@ async def security_guardrail(
     Returns:
         GuardrailFunctionOutput with the check result
     """
-    logger.info("Running security guardrail check")
+    logger.debug("Running security guardrail check")
     
-    # Check for potentially malicious content
-    check_result = check_security(input_text)
+    # Check for potentially malicious content, off the event loop for long input
+    if len(input_text) >= _THREAD_SCAN_THRESHOLD:
+        check_result = await asyncio.get_running_loop().run_in_executor(
+            None, check_security, input_text
+        )
+    else:
+        check_result = check_security(input_text)
     
     # Log the result
     if check_result.is_malicious:
         logger.warning(f"Security guardrail triggered: {check_result.reasoning}")
     else:
-        logger.info("Security guardrail check passed")
+        logger.debug("Security guardrail check passed")
     
     # Return the result
     return GuardrailFunctionOutput(
@@ -208,16 +498,21 @@ async def sensitive_info_guardrail(
     Returns:
         GuardrailFunctionOutput with the check result
     """
-    logger.info("Running sensitive information guardrail check")
+    logger.debug("Running sensitive information guardrail check")
     
-    # Check for sensitive information
-    check_result = check_sensitive_info(output_text)
+    # Check for sensitive information, off the event loop for long output
+    if len(output_text) >= _THREAD_SCAN_THRESHOLD:
+        check_result = await asyncio.get_running_loop().run_in_executor(
+            None, check_sensitive_info, output_text
+        )
+    else:
+        check_result = check_sensitive_info(output_text)
     
     # Log the result
     if check_result.contains_sensitive_info:
         logger.warning(f"Sensitive information guardrail triggered: {check_result.reasoning}")
     else:
-        logger.info("Sensitive information guardrail check passed")
+        logger.debug("Sensitive information guardrail check passed")
     
     # Return the result
     return GuardrailFunctionOutput(
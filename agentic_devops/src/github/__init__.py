@@ -19,7 +19,8 @@ from .github_tools import (
     get_repository,
     list_issues,
     create_issue,
-    list_pull_requests
+    list_pull_requests,
+    aclose
 )
 
 __all__ = [
@@ -36,5 +37,6 @@ __all__ = [
     'get_repository',
     'list_issues',
     'create_issue',
-    'list_pull_requests'
+    'list_pull_requests',
+    'aclose'
 ]
\ No newline at end of file
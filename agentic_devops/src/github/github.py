@@ -9,22 +9,109 @@ import os
 import logging
 import json
 import base64
+import codecs
+import functools
+import hashlib
+import sqlite3
+import zlib
 import re
 import time
+import asyncio
+import threading
+import httpx
 import requests
-from typing import Dict, Any, Optional, List, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Union
 from urllib.parse import urljoin, quote
 
-from ..core.config import get_config
+from ..core.config import get_config, get_config_value
 from ..core.credentials import GitHubCredentials, get_credential_manager
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Use orjson for request and response bodies when it is installed
+try:
+    import orjson
+    
+    def _json_dumps(data: Any) -> bytes:
+        """Serialize data to compact JSON with sorted keys."""
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        """Serialize data to compact JSON with sorted keys."""
+        return json.dumps(data, sort_keys=True, separators=(",", ":"), default=str).encode()
+    
+    _json_loads = json.loads
+
 # Constants
 DEFAULT_API_URL = "https://api.github.com"
 DEFAULT_PAGE_SIZE = 100
 DEFAULT_CACHE_TTL = 60  # 1 minute
+MAX_CACHE_ENTRIES = 1024
+CACHE_DB_MAX_AGE = 7 * 24 * 3600  # Drop persisted entries older than a week
+RATE_LIMIT_THROTTLE_THRESHOLD = 50  # Spread requests out once fewer than this remain
+CONTENT_CHUNK_SIZE = 64 * 1024  # Read size when streaming file blobs
+
+# Cache TTL in seconds by endpoint pattern, checked in order; endpoints that
+# match none use DEFAULT_CACHE_TTL
+CACHE_POLICIES = (
+    (re.compile(r'/branches'), 30),
+    (re.compile(r'/contents/'), 120),
+    (re.compile(r'/readme'), 600),
+    # A single repository, or a user's or organization's repository list
+    (re.compile(r'\A/?repos/[^/]+/[^/]+\Z'), 600),
+    (re.compile(r'\A/?(?:user|users/[^/]+|orgs/[^/]+)/repos\Z'), 600),
+)
+
+# Valid repository names; \Z (unlike $) does not accept a trailing newline
+_REPO_NAME_RE = re.compile(r'\A[A-Za-z0-9_.\-]+\Z')
+
+# Page number of the rel="last" link in a paginated response's Link header
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# Retries for idempotent requests that hit a transient gateway error
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+    raise_on_status=False
+)
+
+# Repository metadata and an optional branch in one GraphQL query
+REPOSITORY_BUNDLE_QUERY = """
+query($owner: String!, $name: String!, $branch: String!, $withBranch: Boolean!) {
+  repository(owner: $owner, name: $name) {
+    name
+    nameWithOwner
+    owner { login }
+    defaultBranchRef { name target { oid } }
+    branch: ref(qualifiedName: $branch) @include(if: $withBranch) { name target { oid } }
+  }
+}
+"""
+
+# Connection pool limits for the async HTTP client. HTTP/2 multiplexes
+# concurrent requests over one connection per host, so only a few are needed.
+ASYNC_HTTP_LIMITS = httpx.Limits(
+    max_connections=8,
+    max_keepalive_connections=8,
+    keepalive_expiry=75
+)
+# Fail fast on connect so an unreachable host doesn't hold up gathered requests
+ASYNC_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote_path(path: str) -> str:
+    """Percent-encode a file path or branch name for use in an endpoint."""
+    return quote(path, safe="/")
 
 
 class GitHubError(Exception):
@@ -66,7 +153,10 @@ class GitHubService:
         api_url: str = DEFAULT_API_URL,
         organization: Optional[str] = None,
         use_agent_endpoint: bool = False,
-        agent_url: Optional[str] = None
+        agent_url: Optional[str] = None,
+        cache_path: Optional[str] = None,
+        tokens: Optional[List[str]] = None,
+        verify: Optional[bool] = None
     ):
         """
         Initialize the GitHub service.
@@ -77,15 +167,32 @@ class GitHubService:
             organization: Default GitHub organization to use.
             use_agent_endpoint: Whether to use the agent endpoint instead of direct GitHub API.
             agent_url: URL of the agent endpoint, if use_agent_endpoint is True.
+            cache_path: SQLite file to persist cached responses in across runs. If None,
+                        uses GITHUB_CACHE_PATH if set, otherwise responses are only
+                        cached in memory.
+            tokens: Additional GitHub API tokens. Requests rotate between these and
+                    token, so each token's rate limit adds to the total budget.
+            verify: Whether to check the token with a request to the API now. If None,
+                    uses the github.verify_access setting (off by default), and an
+                    invalid token is reported by the first real request instead.
             
         Raises:
-            AuthenticationError: If token is not provided and cannot be loaded.
+            AuthenticationError: If token is not provided and cannot be loaded, or
+                                 verification fails.
         """
         self.api_url = api_url
         self.organization = organization
         self.use_agent_endpoint = use_agent_endpoint
         self.agent_url = agent_url
         
+        # Base URL that endpoints are appended to
+        if self.use_agent_endpoint and self.agent_url:
+            # If using agent endpoint, construct URL for that
+            self._base_url = self.agent_url.rstrip("/") + "/"
+        else:
+            # Direct GitHub API call
+            self._base_url = self.api_url.rstrip("/") + "/"
+        
         # Set up credentials
         if token:
             self.token = token
@@ -100,6 +207,11 @@ class GitHubService:
         if not self.token:
             raise AuthenticationError("GitHub token is required")
         
+        # Token pool; self.token stays the primary token
+        self._tokens = [self.token] + [t for t in tokens or [] if t and t != self.token]
+        self._token_idx = 0
+        self._token_lock = threading.Lock()
+        
         # Load configuration
         self.config = get_config()
         
@@ -112,10 +224,60 @@ class GitHubService:
             )
         
         # Initialize cache
-        self.cache: Dict[str, Dict[str, Any]] = {}
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_db = self._open_cache_db(cache_path or os.environ.get("GITHUB_CACHE_PATH"))
+        
+        # HTTP session, so connections are kept alive and reused between requests
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=HTTP_RETRY)
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+        
+        # Async HTTP client, created on first async request
+        self._async_client: Optional[httpx.AsyncClient] = None
+        
+        # Async GETs in flight, so concurrent identical requests share one call
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        
+        # Last seen rate limit budget per token as (remaining, reset), used to
+        # throttle requests before it runs out
+        self._rate_limits: Dict[str, Tuple[int, int]] = {}
+        
+        # Verify access, if asked to; this costs a request and a rate limit point
+        if verify is None:
+            verify = get_config_value("github.verify_access", False)
+        if verify:
+            self._verify_access()
+    
+    def _open_cache_db(self, cache_path: Optional[str]) -> Optional[sqlite3.Connection]:
+        """
+        Open the SQLite file that persists cached responses.
         
-        # Verify access
-        self._verify_access()
+        Args:
+            cache_path: Path to the SQLite file, or None to cache in memory only
+            
+        Returns:
+            Database connection, or None if no path is given or it cannot be opened
+        """
+        if not cache_path:
+            return None
+        
+        try:
+            path = os.path.expanduser(cache_path)
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS gh_cache ("
+                "key TEXT PRIMARY KEY, body BLOB, etag TEXT, last_modified TEXT, timestamp REAL)"
+            )
+            db.execute("DELETE FROM gh_cache WHERE timestamp < ?", (time.time() - CACHE_DB_MAX_AGE,))
+            return db
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to open GitHub cache file {cache_path}: {e}")
+            return None
     
     def _verify_access(self) -> None:
         """
@@ -130,6 +292,302 @@ class GitHubService:
         except Exception as e:
             raise AuthenticationError(f"GitHub authentication failed: {e}")
     
+    def _build_url(self, endpoint: str) -> str:
+        """
+        Build the full URL for an API endpoint.
+        
+        Args:
+            endpoint: API endpoint (e.g., "repos/{owner}/{repo}")
+            
+        Returns:
+            Full URL on the agent endpoint or the GitHub API
+        """
+        # Relative endpoints such as "../graphql" need urljoin to resolve them
+        if endpoint.startswith("../"):
+            return urljoin(self._base_url, endpoint)
+        return self._base_url + endpoint.lstrip("/")
+    
+    def _build_headers(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        cached: Optional[Dict[str, Any]] = None,
+        json_body: bool = False,
+        token: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Build the request headers.
+        
+        Args:
+            headers: Additional headers
+            cached: Cache entry to revalidate with a conditional request
+            json_body: Whether the request has a JSON body
+            token: Token to authorize with. If None, uses the primary token
+            
+        Returns:
+            Default headers merged with the additional headers
+        """
+        request_headers = {
+            "Accept": "application/vnd.github.v3+json",
+            "User-Agent": "DevOpsAgent/0.1.0"
+        }
+        
+        # Add authorization header unless using agent endpoint
+        if not self.use_agent_endpoint:
+            request_headers["Authorization"] = f"token {token or self.token}"
+        
+        if json_body:
+            request_headers["Content-Type"] = "application/json"
+        
+        # Ask GitHub to answer 304 Not Modified if the cached data is still current
+        if cached:
+            if cached.get("etag"):
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+        
+        # Add custom headers
+        if headers:
+            request_headers.update(headers)
+        
+        return request_headers
+    
+    def _cache_key(self, method: str, full_url: str, params: Optional[Dict[str, Any]]) -> str:
+        """
+        Build the key that identifies a request in the cache.
+        
+        Args:
+            method: HTTP method
+            full_url: Full request URL
+            params: Query parameters
+            
+        Returns:
+            Cache key
+        """
+        # Sort the parameters so equivalent requests share an entry, and hash
+        # the key to keep it short. The primary token is included so a persisted
+        # cache never serves one token's responses to another.
+        return hashlib.blake2b(
+            f"{self.token}|{method}|{full_url}|".encode() + _json_dumps(params or {}),
+            digest_size=16
+        ).hexdigest()
+    
+    def _get_cached(
+        self,
+        method: str,
+        full_url: str,
+        params: Optional[Dict[str, Any]]
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Look up the cache entry for a GET request.
+        
+        Args:
+            method: HTTP method
+            full_url: Full request URL
+            params: Query parameters
+            
+        Returns:
+            Tuple of the cache key and the cache entry (None if not cached). The
+            entry may be older than the caller's TTL; its ETag and Last-Modified
+            values can still be used to revalidate it.
+        """
+        cache_key = self._cache_key(method, full_url, params)
+        with self._cache_lock:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.cache.move_to_end(cache_key)
+                return cache_key, cached
+            
+            # Fall back to the persisted cache
+            if self._cache_db is not None:
+                try:
+                    row = self._cache_db.execute(
+                        "SELECT body, etag, last_modified, timestamp FROM gh_cache WHERE key = ?",
+                        (cache_key,)
+                    ).fetchone()
+                    if row:
+                        cached = {
+                            "timestamp": row[3],
+                            "data": _json_loads(zlib.decompress(row[0])),
+                            "etag": row[1],
+                            "last_modified": row[2]
+                        }
+                        self.cache[cache_key] = cached
+                except (sqlite3.Error, zlib.error, ValueError) as e:
+                    logger.debug(f"Ignoring unreadable GitHub cache entry: {e}")
+        return cache_key, cached
+    
+    def _store_cached(self, cache_key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store a cache entry, evicting the least recently used entries beyond MAX_CACHE_ENTRIES.
+        
+        Args:
+            cache_key: Cache key
+            entry: Cache entry
+        """
+        with self._cache_lock:
+            self.cache[cache_key] = entry
+            self.cache.move_to_end(cache_key)
+            while len(self.cache) > MAX_CACHE_ENTRIES:
+                self.cache.popitem(last=False)
+            
+            if self._cache_db is not None:
+                try:
+                    self._cache_db.execute(
+                        "INSERT OR REPLACE INTO gh_cache VALUES (?, ?, ?, ?, ?)",
+                        (
+                            cache_key,
+                            zlib.compress(_json_dumps(entry["data"])),
+                            entry.get("etag"),
+                            entry.get("last_modified"),
+                            entry["timestamp"]
+                        )
+                    )
+                except sqlite3.Error as e:
+                    logger.debug(f"Failed to persist GitHub cache entry: {e}")
+    
+    @staticmethod
+    def _ttl_for(endpoint: str) -> int:
+        """
+        Get the cache TTL for an endpoint from CACHE_POLICIES.
+        
+        Args:
+            endpoint: API endpoint
+            
+        Returns:
+            Cache TTL in seconds
+        """
+        for pattern, ttl in CACHE_POLICIES:
+            if pattern.search(endpoint):
+                return ttl
+        return DEFAULT_CACHE_TTL
+    
+    def _next_token(self) -> str:
+        """
+        Pick the token for the next request, rotating through the token pool.
+        
+        Tokens whose rate limit is used up are skipped until it resets. If every
+        token is used up, the one that resets first is returned.
+        
+        Returns:
+            GitHub API token
+        """
+        if len(self._tokens) == 1:
+            return self.token
+        
+        now = time.time()
+        with self._token_lock:
+            for _ in range(len(self._tokens)):
+                token = self._tokens[self._token_idx]
+                self._token_idx = (self._token_idx + 1) % len(self._tokens)
+                remaining, reset = self._rate_limits.get(token, (1, 0))
+                if remaining > 0 or reset <= now:
+                    return token
+        return min(self._tokens, key=lambda t: self._rate_limits[t][1])
+    
+    def _throttle_delay(self, token: str) -> float:
+        """
+        Get how long to wait before the next request to stay within the rate limit.
+        
+        Once fewer than RATE_LIMIT_THROTTLE_THRESHOLD requests remain for the token,
+        the rest are spread evenly over the time left until the limit resets.
+        
+        Args:
+            token: Token the request will be sent with
+            
+        Returns:
+            Delay in seconds
+        """
+        if token not in self._rate_limits:
+            return 0.0
+        remaining, reset = self._rate_limits[token]
+        if remaining <= 0 or remaining >= RATE_LIMIT_THROTTLE_THRESHOLD:
+            return 0.0
+        return max(0.0, (reset - time.time()) / remaining)
+    
+    def _handle_response(
+        self,
+        response: Any,
+        endpoint: str,
+        cache_key: Optional[str],
+        raw_response: bool,
+        cached: Optional[Dict[str, Any]] = None,
+        token: Optional[str] = None
+    ) -> Any:
+        """
+        Check a response for errors, then parse and cache it.
+        
+        Args:
+            response: requests or httpx response
+            endpoint: API endpoint, used in error messages
+            cache_key: Cache key to store the result under, or None to skip caching
+            raw_response: Whether to return the raw response object
+            cached: Cache entry the request was conditional on, if any
+            token: Token the request was sent with. If None, the primary token
+            
+        Returns:
+            Parsed JSON response or raw response if raw_response is True
+            
+        Raises:
+            GitHubError: If the request fails
+            RateLimitError: If rate limits are exceeded
+            ResourceNotFoundError: If the resource is not found
+            AuthenticationError: If authentication fails
+        """
+        # Cached data is still current; 304s don't count against the rate limit
+        if response.status_code == 304 and cached is not None and not raw_response:
+            self._store_cached(cache_key, {**cached, "timestamp": time.time()})
+            return cached["data"]
+        
+        # Check for rate limit
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining:
+            reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
+            self._rate_limits[token or self.token] = (int(remaining), reset_time)
+        if remaining and int(remaining) == 0:
+            wait_time = max(0, reset_time - int(time.time()))
+            raise RateLimitError(
+                f"GitHub API rate limit exceeded. Resets in {wait_time} seconds."
+            )
+        
+        # Handle common error responses
+        if response.status_code == 404:
+            raise ResourceNotFoundError(f"GitHub resource not found: {endpoint}")
+        
+        if response.status_code == 401:
+            raise AuthenticationError("GitHub authentication failed")
+        
+        if response.status_code == 403:
+            if "rate limit" in response.text.lower():
+                raise RateLimitError("GitHub API rate limit exceeded")
+            else:
+                raise GitHubError(f"GitHub API access forbidden: {response.text}")
+        
+        if response.status_code >= 400:
+            raise GitHubError(
+                f"GitHub API error ({response.status_code}): {response.text}"
+            )
+        
+        # Return raw response if requested
+        if raw_response:
+            return response
+        
+        # Parse JSON response
+        try:
+            result = _json_loads(response.content) if response.content else {}
+        except json.JSONDecodeError as e:
+            raise GitHubError(f"Failed to parse GitHub API response: {e}")
+        
+        # Cache successful GET responses
+        if cache_key:
+            self._store_cached(cache_key, {
+                "timestamp": time.time(),
+                "data": result,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified")
+            })
+        
+        return result
+    
     def _make_request(
         self,
         method: str,
@@ -138,8 +596,9 @@ class GitHubService:
         data: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         use_cache: bool = False,
-        cache_ttl: int = DEFAULT_CACHE_TTL,
-        raw_response: bool = False
+        cache_ttl: Optional[int] = None,
+        raw_response: bool = False,
+        stream: bool = False
     ) -> Any:
         """
         Make an HTTP request to the GitHub API.
@@ -151,8 +610,10 @@ class GitHubService:
             data: Request body data
             headers: Additional headers
             use_cache: Whether to use cached response (for GET requests only)
-            cache_ttl: Cache TTL in seconds
+            cache_ttl: Cache TTL in seconds. If None, uses the endpoint's CACHE_POLICIES TTL
             raw_response: Whether to return the raw response object
+            stream: Whether to leave the body unread so a raw response can be
+                    consumed with iter_content
             
         Returns:
             Parsed JSON response or raw response if raw_response is True
@@ -163,102 +624,225 @@ class GitHubService:
             ResourceNotFoundError: If the resource is not found
             AuthenticationError: If authentication fails
         """
-        # Determine the URL
-        if self.use_agent_endpoint and self.agent_url:
-            # If using agent endpoint, construct URL for that
-            base_url = self.agent_url.rstrip("/") + "/"
-            full_url = urljoin(base_url, endpoint)
-        else:
-            # Direct GitHub API call
-            base_url = self.api_url.rstrip("/") + "/"
-            full_url = urljoin(base_url, endpoint)
+        full_url = self._build_url(endpoint)
         
         # Check cache for GET requests
         cache_key = None
+        cached = None
         if method == "GET" and use_cache:
-            cache_key = f"{method}:{full_url}:{json.dumps(params or {})}"
-            cached = self.cache.get(cache_key)
+            cache_key, cached = self._get_cached(method, full_url, params)
+            if cache_ttl is None:
+                cache_ttl = self._ttl_for(endpoint)
             if cached and time.time() - cached["timestamp"] < cache_ttl:
                 return cached["data"]
         
-        # Prepare headers
-        request_headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "DevOpsAgent/0.1.0"
-        }
-        
-        # Add authorization header unless using agent endpoint
-        if not self.use_agent_endpoint:
-            request_headers["Authorization"] = f"token {self.token}"
-        
-        # Add custom headers
-        if headers:
-            request_headers.update(headers)
+        token = self._next_token()
+        delay = self._throttle_delay(token)
+        if delay:
+            logger.debug(f"Throttling GitHub request for {delay:.2f}s to stay within the rate limit")
+            time.sleep(delay)
         
         # Make the request
         try:
-            response = requests.request(
+            response = self._http.request(
                 method=method,
                 url=full_url,
                 params=params,
-                json=data,
-                headers=request_headers
+                data=_json_dumps(data) if data is not None else None,
+                headers=self._build_headers(headers, cached, json_body=data is not None, token=token),
+                stream=stream
             )
+        except requests.RequestException as e:
+            raise GitHubError(f"GitHub API request failed: {e}")
+        
+        return self._handle_response(response, endpoint, cache_key, raw_response, cached, token)
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get the async HTTP client, creating it on first use.
+        
+        The client keeps connections alive between requests, so concurrent async
+        calls share a small pool instead of opening a connection each. It is bound
+        to the event loop it is first used on; call aclose() before reusing the
+        service on another loop.
+        
+        Returns:
+            Async HTTP client
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                http2=True,
+                limits=ASYNC_HTTP_LIMITS,
+                timeout=ASYNC_HTTP_TIMEOUT
+            )
+        return self._async_client
+    
+    async def _make_request_async(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        use_cache: bool = False,
+        cache_ttl: Optional[int] = None,
+        raw_response: bool = False
+    ) -> Any:
+        """
+        Make an HTTP request to the GitHub API without blocking the event loop.
+        
+        Takes the same arguments as _make_request and shares its cache and
+        error handling. Concurrent identical GETs are coalesced into one request.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint: API endpoint (e.g., "repos/{owner}/{repo}")
+            params: Query parameters
+            data: Request body data
+            headers: Additional headers
+            use_cache: Whether to use cached response (for GET requests only)
+            cache_ttl: Cache TTL in seconds. If None, uses the endpoint's CACHE_POLICIES TTL
+            raw_response: Whether to return the raw response object
             
-            # Check for rate limit
-            remaining = response.headers.get("X-RateLimit-Remaining")
-            if remaining and int(remaining) == 0:
-                reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
-                wait_time = max(0, reset_time - int(time.time()))
-                raise RateLimitError(
-                    f"GitHub API rate limit exceeded. Resets in {wait_time} seconds."
-                )
-            
-            # Handle common error responses
-            if response.status_code == 404:
-                raise ResourceNotFoundError(f"GitHub resource not found: {endpoint}")
-            
-            if response.status_code == 401:
-                raise AuthenticationError("GitHub authentication failed")
-            
-            if response.status_code == 403:
-                if "rate limit" in response.text.lower():
-                    raise RateLimitError("GitHub API rate limit exceeded")
-                else:
-                    raise GitHubError(f"GitHub API access forbidden: {response.text}")
-            
-            if response.status_code >= 400:
-                raise GitHubError(
-                    f"GitHub API error ({response.status_code}): {response.text}"
-                )
-            
-            # Return raw response if requested
-            if raw_response:
-                return response
+        Returns:
+            Parsed JSON response or raw response if raw_response is True
             
-            # Parse JSON response
-            result = response.json() if response.content else {}
+        Raises:
+            GitHubError: If the request fails
+            RateLimitError: If rate limits are exceeded
+            ResourceNotFoundError: If the resource is not found
+            AuthenticationError: If authentication fails
+        """
+        full_url = self._build_url(endpoint)
+        
+        # Check cache for GET requests
+        cache_key = None
+        cached = None
+        if method == "GET" and use_cache:
+            cache_key, cached = self._get_cached(method, full_url, params)
+            if cache_ttl is None:
+                cache_ttl = self._ttl_for(endpoint)
+            if cached and time.time() - cached["timestamp"] < cache_ttl:
+                return cached["data"]
+        
+        if method != "GET" or raw_response:
+            return await self._send_request_async(
+                method, endpoint, full_url, params, data, headers, cache_key, cached, raw_response
+            )
+        
+        # Wait for an identical GET that is already in flight instead of sending another.
+        # The request runs in its own task and every caller awaits it through a shield,
+        # so cancelling one caller cancels neither the request nor the other callers.
+        inflight_key = cache_key or self._cache_key(method, full_url, params)
+        pending = self._inflight.get(inflight_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._send_request_async(
+                method, endpoint, full_url, params, data, headers, cache_key, cached, raw_response
+            ))
+            self._inflight[inflight_key] = pending
+            
+            def finished(task: "asyncio.Future[Any]") -> None:
+                if self._inflight.get(inflight_key) is task:
+                    del self._inflight[inflight_key]
+                # Mark the exception as retrieved in case every caller was cancelled
+                if not task.cancelled():
+                    task.exception()
+            
+            pending.add_done_callback(finished)
+        
+        return await asyncio.shield(pending)
+    
+    async def _send_request_async(
+        self,
+        method: str,
+        endpoint: str,
+        full_url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        cache_key: Optional[str],
+        cached: Optional[Dict[str, Any]],
+        raw_response: bool
+    ) -> Any:
+        """
+        Send an async request and handle its response, bypassing the cache lookup.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            full_url: Full request URL
+            params: Query parameters
+            data: Request body data
+            headers: Additional headers
+            cache_key: Cache key to store the result under, or None to skip caching
+            cached: Cache entry to revalidate, if any
+            raw_response: Whether to return the raw response object
             
-            # Cache successful GET responses
-            if method == "GET" and use_cache and cache_key:
-                self.cache[cache_key] = {
-                    "timestamp": time.time(),
-                    "data": result
-                }
+        Returns:
+            Parsed JSON response or raw response if raw_response is True
+        """
+        token = self._next_token()
+        delay = self._throttle_delay(token)
+        if delay:
+            logger.debug(f"Throttling GitHub request for {delay:.2f}s to stay within the rate limit")
+            await asyncio.sleep(delay)
+        
+        # Make the request
+        try:
+            response = await self._get_async_client().request(
+                method,
+                full_url,
+                params=params,
+                content=_json_dumps(data) if data is not None else None,
+                headers=self._build_headers(headers, cached, json_body=data is not None, token=token)
+            )
+        except httpx.HTTPError as e:
+            raise GitHubError(f"GitHub API request failed: {e}")
+        
+        return self._handle_response(response, endpoint, cache_key, raw_response, cached, token)
+    
+    def _graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run a query against the GitHub GraphQL API.
+        
+        Args:
+            query: GraphQL query
+            variables: Query variables
             
-            return result
+        Returns:
+            The "data" object of the response
             
-        except (ResourceNotFoundError, AuthenticationError, RateLimitError) as e:
-            # Re-raise known exceptions
-            raise
-        except requests.RequestException as e:
-            raise GitHubError(f"GitHub API request failed: {e}")
-        except json.JSONDecodeError as e:
-            raise GitHubError(f"Failed to parse GitHub API response: {e}")
+        Raises:
+            ResourceNotFoundError: If the query refers to a resource that does not exist
+            GitHubError: If the query fails
+        """
+        # GitHub Enterprise serves GraphQL at /api/graphql next to /api/v3
+        endpoint = "../graphql" if self.api_url.rstrip("/").endswith("/v3") else "graphql"
+        response = self._make_request(
+            "POST", endpoint, data={"query": query, "variables": variables or {}}
+        )
+        
+        errors = response.get("errors")
+        if errors:
+            message = "; ".join(error.get("message", "") for error in errors)
+            if any(error.get("type") == "NOT_FOUND" for error in errors):
+                raise ResourceNotFoundError(f"GitHub resource not found: {message}")
+            raise GitHubError(f"GitHub GraphQL query failed: {message}")
+        
+        return response.get("data") or {}
+    
+    async def aclose(self) -> None:
+        """Close the async HTTP client and its connections."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
     
     def clear_cache(self) -> None:
-        """Clear the request cache."""
-        self.cache.clear()
+        """Clear the request cache, including any persisted entries."""
+        with self._cache_lock:
+            self.cache.clear()
+            if self._cache_db is not None:
+                self._cache_db.execute("DELETE FROM gh_cache")
     
     def _get_repo_path(self, repo: str, owner: Optional[str] = None) -> str:
         """
@@ -290,18 +874,17 @@ class GitHubService:
     # Repository Management
     #
     
-    def list_repositories(
+    def _repositories_request(
         self,
-        org: Optional[str] = None,
-        user: Optional[str] = None,
-        type: str = "all",
-        sort: str = "updated",
-        direction: str = "desc",
-        per_page: int = DEFAULT_PAGE_SIZE,
-        use_cache: bool = True
-    ) -> List[Dict[str, Any]]:
+        org: Optional[str],
+        user: Optional[str],
+        type: str,
+        sort: str,
+        direction: str,
+        per_page: int
+    ) -> Tuple[str, Dict[str, Any]]:
         """
-        List repositories for the specified organization or user.
+        Build the endpoint and query parameters for listing repositories.
         
         Args:
             org: Organization name. If None, uses default organization.
@@ -310,10 +893,9 @@ class GitHubService:
             sort: Sort field (created, updated, pushed, full_name).
             direction: Sort direction (asc, desc).
             per_page: Number of results per page.
-            use_cache: Whether to use cached response.
             
         Returns:
-            List of repository details.
+            Tuple of the endpoint and the query parameters.
             
         Raises:
             ValidationError: If neither org nor user is specified and no default org.
@@ -339,7 +921,39 @@ class GitHubService:
             
             endpoint = f"orgs/{organization}/repos"
             params["type"] = type
+        
+        return endpoint, params
+    
+    def list_repositories(
+        self,
+        org: Optional[str] = None,
+        user: Optional[str] = None,
+        type: str = "all",
+        sort: str = "updated",
+        direction: str = "desc",
+        per_page: int = DEFAULT_PAGE_SIZE,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        List repositories for the specified organization or user.
+        
+        Args:
+            org: Organization name. If None, uses default organization.
+            user: User name. If specified, lists user's repositories instead of org's.
+            type: Repository type (all, public, private, forks, sources, member).
+            sort: Sort field (created, updated, pushed, full_name).
+            direction: Sort direction (asc, desc).
+            per_page: Number of results per page.
+            use_cache: Whether to use cached response.
+            
+        Returns:
+            List of repository details.
             
+        Raises:
+            ValidationError: If neither org nor user is specified and no default org.
+        """
+        endpoint, params = self._repositories_request(org, user, type, sort, direction, per_page)
+        
         # Get all pages of results
         all_repos = []
         page = 1
@@ -362,6 +976,58 @@ class GitHubService:
         
         return all_repos
     
+    async def list_repositories_async(
+        self,
+        org: Optional[str] = None,
+        user: Optional[str] = None,
+        type: str = "all",
+        sort: str = "updated",
+        direction: str = "desc",
+        per_page: int = DEFAULT_PAGE_SIZE,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        List repositories for the specified organization or user, fetching pages concurrently.
+        
+        The first page is always fetched from the API, since its Link header gives
+        the number of pages; the remaining pages are then fetched at once.
+        
+        Args:
+            org: Organization name. If None, uses default organization.
+            user: User name. If specified, lists user's repositories instead of org's.
+            type: Repository type (all, public, private, forks, sources, member).
+            sort: Sort field (created, updated, pushed, full_name).
+            direction: Sort direction (asc, desc).
+            per_page: Number of results per page.
+            use_cache: Whether to use cached responses for the remaining pages.
+            
+        Returns:
+            List of repository details.
+            
+        Raises:
+            ValidationError: If neither org nor user is specified and no default org.
+        """
+        endpoint, params = self._repositories_request(org, user, type, sort, direction, per_page)
+        
+        response = await self._make_request_async(
+            "GET", endpoint, params={**params, "page": 1}, raw_response=True
+        )
+        all_repos = _json_loads(response.content) if response.content else []
+        
+        # Fetch the remaining pages concurrently
+        match = _LAST_PAGE_RE.search(response.headers.get("Link", ""))
+        if match:
+            pages = await asyncio.gather(*[
+                self._make_request_async(
+                    "GET", endpoint, params={**params, "page": page}, use_cache=use_cache
+                )
+                for page in range(2, int(match.group(1)) + 1)
+            ])
+            for page in pages:
+                all_repos.extend(page)
+        
+        return all_repos
+    
     def get_repository(
         self,
         repo: str,
@@ -385,6 +1051,56 @@ class GitHubService:
         repo_path = self._get_repo_path(repo, owner)
         return self._make_request("GET", repo_path, use_cache=use_cache)
     
+    def get_repository_bundle(
+        self,
+        repo: str,
+        branch: Optional[str] = None,
+        owner: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get repository details and a branch in a single GraphQL request.
+        
+        Args:
+            repo: Repository name or full path (owner/repo).
+            branch: Branch to look up. If None, only the default branch is returned.
+            owner: Repository owner. If None, uses owner from repo or default organization.
+            
+        Returns:
+            Dictionary with "repository" (name, full_name, owner login and
+            default_branch, as in the REST API) and "branch" (name and commit sha,
+            or None if the branch does not exist).
+            
+        Raises:
+            ResourceNotFoundError: If the repository does not exist.
+        """
+        _, repo_owner, repo_name = self._get_repo_path(repo, owner).split("/", 2)
+        data = self._graphql(REPOSITORY_BUNDLE_QUERY, {
+            "owner": repo_owner,
+            "name": repo_name,
+            "branch": branch or "",
+            "withBranch": bool(branch)
+        })
+        
+        repository = data.get("repository")
+        if not repository:
+            raise ResourceNotFoundError(f"GitHub resource not found: {repo_owner}/{repo_name}")
+        
+        default_ref = repository.get("defaultBranchRef")
+        branch_ref = repository.get("branch") if branch else default_ref
+        
+        return {
+            "repository": {
+                "name": repository["name"],
+                "full_name": repository["nameWithOwner"],
+                "owner": {"login": repository["owner"]["login"]},
+                "default_branch": default_ref["name"] if default_ref else None
+            },
+            "branch": {
+                "name": branch_ref["name"],
+                "commit": {"sha": branch_ref["target"]["oid"]}
+            } if branch_ref else None
+        }
+    
     def create_repository(
         self,
         name: str,
@@ -416,7 +1132,7 @@ class GitHubService:
             GitHubError: If repository creation fails.
         """
         # Validate repository name
-        if not re.match(r'^[a-zA-Z0-9_.-]+$', name):
+        if not _REPO_NAME_RE.match(name):
             raise ValidationError(
                 "Invalid repository name. Use only letters, numbers, hyphens, dots, and underscores."
             )
@@ -476,13 +1192,69 @@ class GitHubService:
     # Content Operations
     #
     
+    def _get_raw_text(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Get a file's text using the raw media type, which skips base64 encoding.
+        
+        The response is not cached, since the cache is keyed without the Accept
+        header and holds the JSON form of these endpoints.
+        
+        Args:
+            endpoint: Contents or readme API endpoint
+            params: Query parameters
+            
+        Returns:
+            File content
+        """
+        response = self._make_request(
+            "GET",
+            endpoint,
+            params=params,
+            headers={"Accept": "application/vnd.github.raw"},
+            raw_response=True
+        )
+        return response.content.decode("utf-8")
+    
+    def _get_blob_text(self, repo_path: str, sha: str) -> str:
+        """
+        Download a file blob as text, streaming it in chunks.
+        
+        The contents API leaves out the content of files over 1 MB. The raw blob
+        endpoint serves them without base64, and decoding it chunk by chunk avoids
+        holding the raw, base64 and decoded copies of the file at once.
+        
+        Args:
+            repo_path: Repository path (repos/{owner}/{repo})
+            sha: Blob SHA
+            
+        Returns:
+            Decoded file content
+        """
+        response = self._make_request(
+            "GET",
+            f"{repo_path}/git/blobs/{sha}",
+            headers={"Accept": "application/vnd.github.raw"},
+            raw_response=True,
+            stream=True
+        )
+        try:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            parts = [decoder.decode(chunk) for chunk in response.iter_content(CONTENT_CHUNK_SIZE)]
+            parts.append(decoder.decode(b"", final=True))
+        except requests.RequestException as e:
+            raise GitHubError(f"GitHub API request failed: {e}")
+        finally:
+            response.close()
+        return "".join(parts)
+    
     def get_readme(
         self,
         repo: str,
         owner: Optional[str] = None,
         ref: Optional[str] = None,
-        use_cache: bool = True
-    ) -> Dict[str, Any]:
+        use_cache: bool = True,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], str]:
         """
         Get the README content for a repository.
         
@@ -490,10 +1262,12 @@ class GitHubService:
             repo: Repository name or full path (owner/repo).
             owner: Repository owner. If None, uses owner from repo or default organization.
             ref: Git reference (branch, tag, commit). If None, uses the default branch.
-            use_cache: Whether to use cached response.
+            use_cache: Whether to use cached response. Ignored if raw is True.
+            raw: Whether to return only the README text, fetched without the
+                 base64-encoded JSON envelope.
             
         Returns:
-            README content and metadata.
+            README content and metadata, or the README text if raw is True.
             
         Raises:
             ResourceNotFoundError: If the README does not exist.
@@ -502,16 +1276,21 @@ class GitHubService:
         params = {}
         if ref:
             params["ref"] = ref
+        
+        if raw:
+            return self._get_raw_text(f"{repo_path}/readme", params)
             
         response = self._make_request(
             "GET", f"{repo_path}/readme", params=params, use_cache=use_cache
         )
         
-        # Decode content if it's base64 encoded
+        # Decode content if it's base64 encoded; b64decode skips the newlines
+        # GitHub wraps the content with
         if response.get("encoding") == "base64" and response.get("content"):
-            response["decoded_content"] = base64.b64decode(
-                response["content"].replace("\n", "")
-            ).decode("utf-8")
+            response["decoded_content"] = base64.b64decode(response["content"]).decode("utf-8")
+        elif response.get("encoding") == "none" and response.get("sha"):
+            # Too large to be inlined; fetch the blob itself
+            response["decoded_content"] = self._get_blob_text(repo_path, response["sha"])
             
         return response
     
@@ -521,8 +1300,9 @@ class GitHubService:
         path: str,
         owner: Optional[str] = None,
         ref: Optional[str] = None,
-        use_cache: bool = True
-    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        use_cache: bool = True,
+        raw: bool = False
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], str]:
         """
         Get contents of a file or directory in a repository.
         
@@ -531,10 +1311,13 @@ class GitHubService:
             path: Path to the file or directory.
             owner: Repository owner. If None, uses owner from repo or default organization.
             ref: Git reference (branch, tag, commit). If None, uses the default branch.
-            use_cache: Whether to use cached response.
+            use_cache: Whether to use cached response. Ignored if raw is True.
+            raw: Whether to return only the file's text, fetched without the
+                 base64-encoded JSON envelope. Only valid for files.
             
         Returns:
-            Content and metadata (for a file) or list of contents (for a directory).
+            Content and metadata (for a file) or list of contents (for a directory),
+            or the file's text if raw is True.
             
         Raises:
             ResourceNotFoundError: If the path does not exist.
@@ -543,17 +1326,21 @@ class GitHubService:
         params = {}
         if ref:
             params["ref"] = ref
+        
+        if raw:
+            return self._get_raw_text(f"{repo_path}/contents/{_quote_path(path)}", params)
             
         response = self._make_request(
-            "GET", f"{repo_path}/contents/{path}", params=params, use_cache=use_cache
+            "GET", f"{repo_path}/contents/{_quote_path(path)}", params=params, use_cache=use_cache
         )
         
         # Handle file vs directory response
         if isinstance(response, dict) and response.get("encoding") == "base64":
-            # Single file response
-            response["decoded_content"] = base64.b64decode(
-                response["content"].replace("\n", "")
-            ).decode("utf-8")
+            # Single file response; b64decode skips the line-wrapping newlines
+            response["decoded_content"] = base64.b64decode(response["content"]).decode("utf-8")
+        elif isinstance(response, dict) and response.get("encoding") == "none" and response.get("sha"):
+            # Too large to be inlined; fetch the blob itself
+            response["decoded_content"] = self._get_blob_text(repo_path, response["sha"])
             
         return response
     
@@ -603,7 +1390,7 @@ class GitHubService:
         if author:
             data["author"] = author
             
-        return self._make_request("PUT", f"{repo_path}/contents/{path}", data=data)
+        return self._make_request("PUT", f"{repo_path}/contents/{_quote_path(path)}", data=data)
     
     def update_file(
         self,
@@ -655,7 +1442,7 @@ class GitHubService:
         if author:
             data["author"] = author
             
-        return self._make_request("PUT", f"{repo_path}/contents/{path}", data=data)
+        return self._make_request("PUT", f"{repo_path}/contents/{_quote_path(path)}", data=data)
     
     def delete_file(
         self,
@@ -704,7 +1491,7 @@ class GitHubService:
         if author:
             data["author"] = author
             
-        return self._make_request("DELETE", f"{repo_path}/contents/{path}", data=data)
+        return self._make_request("DELETE", f"{repo_path}/contents/{_quote_path(path)}", data=data)
     
     #
     # Branch Management
@@ -768,7 +1555,7 @@ class GitHubService:
         """
         repo_path = self._get_repo_path(repo, owner)
         return self._make_request(
-            "GET", f"{repo_path}/branches/{branch}", use_cache=use_cache
+            "GET", f"{repo_path}/branches/{_quote_path(branch)}", use_cache=use_cache
         )
     
     def create_branch(
@@ -836,30 +1623,31 @@ class GitHubService:
         """
         # Import here to avoid circular imports
         from ..aws.ec2 import EC2Service
-        from ..aws.s3 import S3Service
-        from ..core.credentials import AWSCredentials, get_credential_manager
-        
-        repo_path = self._get_repo_path(repo, owner)
-        
-        # Get repository details to ensure it exists
-        repo_details = self.get_repository(repo, owner)
-        
-        # Get branch if not specified
-        if not branch:
-            branch = repo_details.get("default_branch", "main")
+        from ..core.credentials import get_credential_manager
         
-        # Check if repository is accessible
-        try:
-            self.get_branch(repo, branch, owner)
-        except ResourceNotFoundError:
-            raise ValidationError(f"Branch '{branch}' not found in repository")
-        
-        # Get AWS credentials
+        # Get repository details and check the branch exists in one request.
+        # Loading AWS credentials is independent and may also hit the network,
+        # so it runs concurrently
         cred_manager = get_credential_manager()
-        aws_credentials = cred_manager.get_aws_credentials(
-            profile_name=aws_profile,
-            region=aws_region
-        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            credentials_future = executor.submit(
+                cred_manager.get_aws_credentials,
+                profile_name=aws_profile,
+                region=aws_region
+            )
+            bundle = self.get_repository_bundle(repo, branch, owner)
+            repo_details = bundle["repository"]
+            
+            # Get branch if not specified
+            if not branch:
+                branch = repo_details.get("default_branch") or "main"
+            
+            # Check if repository is accessible
+            if bundle["branch"] is None:
+                raise ValidationError(f"Branch '{branch}' not found in repository")
+            
+            # Get AWS credentials
+            aws_credentials = credentials_future.result()
         
         # Deploy based on service type
         if service.lower() == 'ec2':
@@ -892,7 +1680,11 @@ class GitHubService:
             }
             
         elif service.lower() == 's3':
-            # Import S3Service here when implemented
+            try:
+                from ..aws.s3 import S3Service
+            except ImportError:
+                raise ValidationError("S3 deployment is not available: src.aws.s3 is not implemented")
+            
             s3_service = S3Service(credentials=aws_credentials)
             
             # Extract required config
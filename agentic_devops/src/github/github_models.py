@@ -6,15 +6,27 @@ pull request requests, and entity representations for use with the OpenAI Agents
 """
 
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, AliasPath, BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
 
+# Shared by all models. Entity models can be validated straight from GitHub API
+# JSON (aliases pick out the API's field names and extra fields are ignored),
+# while still accepting their own field names as keywords.
+MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, populate_by_name=True)
+
+
+def _names(values: Optional[List[Any]], key: str) -> List[str]:
+    """Reduce GitHub API objects (labels, users) to their names."""
+    return [value[key] if isinstance(value, dict) else value for value in values or []]
+
 
 class GitHubRepoRequest(BaseModel):
     """
     Request model for GitHub repository operations.
     """
     
+    model_config = MODEL_CONFIG
+    
     owner: str = Field(
         description="Owner (organization or user) of the repository"
     )
@@ -29,6 +41,8 @@ class GitHubIssueRequest(BaseModel):
     Request model for listing GitHub issues.
     """
     
+    model_config = MODEL_CONFIG
+    
     owner: str = Field(
         description="Owner (organization or user) of the repository"
     )
@@ -83,6 +97,8 @@ class GitHubCreateIssueRequest(BaseModel):
     Request model for creating a GitHub issue.
     """
     
+    model_config = MODEL_CONFIG
+    
     owner: str = Field(
         description="Owner (organization or user) of the repository"
     )
@@ -120,6 +136,8 @@ class GitHubPRRequest(BaseModel):
     Request model for listing GitHub pull requests.
     """
     
+    model_config = MODEL_CONFIG
+    
     owner: str = Field(
         description="Owner (organization or user) of the repository"
     )
@@ -159,6 +177,8 @@ class GitHubRepository(BaseModel):
     Model representing a GitHub repository.
     """
     
+    model_config = MODEL_CONFIG
+    
     name: str = Field(
         description="Name of the repository"
     )
@@ -173,6 +193,7 @@ class GitHubRepository(BaseModel):
     )
     
     url: str = Field(
+        validation_alias=AliasChoices("html_url", "url"),
         description="URL of the repository"
     )
     
@@ -181,14 +202,17 @@ class GitHubRepository(BaseModel):
     )
     
     stars: int = Field(
+        validation_alias=AliasChoices("stargazers_count", "stars"),
         description="Number of stars the repository has"
     )
     
     forks: int = Field(
+        validation_alias=AliasChoices("forks_count", "forks"),
         description="Number of forks the repository has"
     )
     
     open_issues: int = Field(
+        validation_alias=AliasChoices("open_issues_count", "open_issues"),
         description="Number of open issues in the repository"
     )
     
@@ -223,6 +247,8 @@ class GitHubIssue(BaseModel):
     Model representing a GitHub issue.
     """
     
+    model_config = MODEL_CONFIG
+    
     number: int = Field(
         description="Issue number"
     )
@@ -254,6 +280,7 @@ class GitHubIssue(BaseModel):
     )
     
     url: str = Field(
+        validation_alias=AliasChoices("html_url", "url"),
         description="URL of the issue"
     )
     
@@ -276,6 +303,16 @@ class GitHubIssue(BaseModel):
         default=None,
         description="Number of comments on the issue"
     )
+    
+    @field_validator("labels", mode="before")
+    @classmethod
+    def _label_names(cls, value: Any) -> List[str]:
+        return _names(value, "name")
+    
+    @field_validator("assignees", mode="before")
+    @classmethod
+    def _assignee_logins(cls, value: Any) -> List[str]:
+        return _names(value, "login")
 
 
 class GitHubPullRequest(BaseModel):
@@ -283,6 +320,8 @@ class GitHubPullRequest(BaseModel):
     Model representing a GitHub pull request.
     """
     
+    model_config = MODEL_CONFIG
+    
     number: int = Field(
         description="Pull request number"
     )
@@ -319,14 +358,17 @@ class GitHubPullRequest(BaseModel):
     )
     
     url: str = Field(
+        validation_alias=AliasChoices("html_url", "url"),
         description="URL of the pull request"
     )
     
     head_branch: str = Field(
+        validation_alias=AliasChoices(AliasPath("head", "ref"), "head_branch"),
         description="Name of the head branch"
     )
     
     base_branch: str = Field(
+        validation_alias=AliasChoices(AliasPath("base", "ref"), "base_branch"),
         description="Name of the base branch"
     )
     
@@ -378,4 +420,14 @@ class GitHubPullRequest(BaseModel):
     changed_files: Optional[int] = Field(
         default=None,
         description="Number of changed files in the pull request"
-    )
\ No newline at end of file
+    )
+    
+    @field_validator("labels", mode="before")
+    @classmethod
+    def _label_names(cls, value: Any) -> List[str]:
+        return _names(value, "name")
+    
+    @field_validator("assignees", "requested_reviewers", mode="before")
+    @classmethod
+    def _user_logins(cls, value: Any) -> List[str]:
+        return _names(value, "login")
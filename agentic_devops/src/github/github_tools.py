@@ -5,11 +5,16 @@ This module implements function tools for getting repository details, listing is
 creating issues, and listing pull requests, designed to be used with the OpenAI Agents SDK.
 """
 
-import github
+import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import time
+import weakref
+import httpx
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 
 from agents import function_tool, RunContextWrapper
+from pydantic import TypeAdapter
 
 from .github_models import (
     GitHubRepoRequest,
@@ -20,11 +25,237 @@ from .github_models import (
     GitHubIssue,
     GitHubPullRequest
 )
+from .github import (
+    ASYNC_HTTP_LIMITS,
+    ASYNC_HTTP_TIMEOUT,
+    DEFAULT_API_URL,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_PAGE_SIZE,
+    AuthenticationError,
+    GitHubError,
+    RateLimitError,
+    ResourceNotFoundError,
+    _LAST_PAGE_RE,
+    _json_dumps,
+    _json_loads
+)
 from ..core.context import DevOpsContext
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Async HTTP clients shared by all tools, so connections are kept alive and
+# reused between calls; one per event loop, created on first use there
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+# Cached GET responses, least recently used first. Entries older than their
+# TTL are revalidated with their ETag; a 304 costs no rate limit.
+MAX_CACHE_ENTRIES = 512
+REPOSITORY_CACHE_TTL = 300  # Repository details rarely change
+_cache: "OrderedDict[Tuple[Optional[str], str, bytes], Dict[str, Any]]" = OrderedDict()
+
+# Validate whole lists of API objects in one pydantic-core call
+_ISSUES_ADAPTER = TypeAdapter(List[GitHubIssue])
+_PULL_REQUESTS_ADAPTER = TypeAdapter(List[GitHubPullRequest])
+
+
+def _get_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client for the running event loop.
+    
+    A client's connections belong to the event loop that opened them, so one
+    client is kept per loop and reused by every tool call running on it.
+    
+    Returns:
+        Async HTTP client for the GitHub API
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            base_url=DEFAULT_API_URL,
+            http2=True,
+            limits=ASYNC_HTTP_LIMITS,
+            timeout=ASYNC_HTTP_TIMEOUT,
+            headers={
+                "Accept": "application/vnd.github+json",
+                "User-Agent": "DevOpsAgent/0.1.0"
+            }
+        )
+        _clients[loop] = client
+    return client
+
+
+async def aclose() -> None:
+    """
+    Close the running event loop's shared HTTP client and its connections.
+    
+    Call this when shutting down an agent run, before the event loop closes.
+    """
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _github_token(ctx: RunContextWrapper[DevOpsContext]) -> Optional[str]:
+    """Get the GitHub token from the run context, if it has one."""
+    return getattr(ctx.context, "github_token", None)
+
+
+async def _request(
+    github_token: Optional[str],
+    method: str,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    data: Optional[Dict[str, Any]] = None,
+    etag: Optional[str] = None
+) -> httpx.Response:
+    """
+    Make a request to the GitHub API.
+    
+    Args:
+        github_token: GitHub token, or None for an anonymous request
+        method: HTTP method
+        url: API path (e.g., "/repos/{owner}/{repo}") or full URL
+        params: Query parameters
+        data: Request body data
+        etag: ETag of a cached response, to ask for 304 Not Modified if unchanged
+        
+    Returns:
+        Successful or 304 Not Modified response
+        
+    Raises:
+        GitHubError: If the request fails
+        RateLimitError: If rate limits are exceeded
+        ResourceNotFoundError: If the resource is not found
+        AuthenticationError: If authentication fails
+    """
+    headers = {}
+    if github_token:
+        headers["Authorization"] = f"Bearer {github_token}"
+    if data is not None:
+        headers["Content-Type"] = "application/json"
+    if etag:
+        headers["If-None-Match"] = etag
+    
+    try:
+        response = await _get_client().request(
+            method,
+            url,
+            params=params,
+            content=_json_dumps(data) if data is not None else None,
+            headers=headers
+        )
+    except httpx.HTTPError as e:
+        raise GitHubError(f"GitHub API request failed: {e}")
+    
+    # Handle common error responses
+    if response.status_code == 404:
+        raise ResourceNotFoundError(f"GitHub resource not found: {url}")
+    
+    if response.status_code == 401:
+        raise AuthenticationError("GitHub authentication failed")
+    
+    if response.status_code in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0":
+        raise RateLimitError("GitHub API rate limit exceeded")
+    
+    if response.status_code >= 400:
+        raise GitHubError(f"GitHub API error ({response.status_code}): {response.text}")
+    
+    return response
+
+
+async def _get_json(
+    github_token: Optional[str],
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    ttl: int = DEFAULT_CACHE_TTL
+) -> Tuple[Any, str]:
+    """
+    Get a JSON resource from the GitHub API, using the response cache.
+    
+    Args:
+        github_token: GitHub token, or None for an anonymous request
+        url: API path
+        params: Query parameters
+        ttl: Seconds a cached response is used without revalidating it
+        
+    Returns:
+        Tuple of the parsed response and its Link header ("" if none)
+    """
+    # The token is part of the key, since it decides which resources are visible
+    key = (github_token, url, _json_dumps(params or {}))
+    
+    cached = _cache.get(key)
+    if cached is not None:
+        _cache.move_to_end(key)
+        if time.time() - cached["timestamp"] < ttl:
+            return cached["data"], cached["link"]
+    
+    response = await _request(
+        github_token, "GET", url, params=params, etag=cached["etag"] if cached else None
+    )
+    if response.status_code == 304 and cached is not None:
+        cached["timestamp"] = time.time()
+        return cached["data"], cached["link"]
+    
+    data = _json_loads(response.content)
+    link = response.headers.get("Link", "")
+    if response.headers.get("ETag"):
+        _cache[key] = {
+            "timestamp": time.time(),
+            "etag": response.headers["ETag"],
+            "data": data,
+            "link": link
+        }
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+    
+    return data, link
+
+
+async def _get_all_pages(
+    github_token: Optional[str],
+    url: str,
+    params: Dict[str, Any],
+    adapter: TypeAdapter
+) -> List[Any]:
+    """
+    Get every item of a paginated list endpoint, fetching pages concurrently.
+    
+    The first page's Link header gives the number of pages; the remaining pages
+    are then fetched at once. Each page is validated into models as soon as it
+    arrives, so validation overlaps with the pages still in flight.
+    
+    Args:
+        github_token: GitHub token, or None for an anonymous request
+        url: API path of the list endpoint
+        params: Query parameters
+        adapter: TypeAdapter that validates a page of items
+        
+    Returns:
+        Validated items from all pages, in order
+    """
+    params = {**params, "per_page": DEFAULT_PAGE_SIZE}
+    
+    async def get_page(page: int) -> Tuple[List[Any], str]:
+        data, link = await _get_json(github_token, url, params={**params, "page": page})
+        return adapter.validate_python(data), link
+    
+    items, link = await get_page(1)
+    
+    # Fetch the remaining pages concurrently
+    match = _LAST_PAGE_RE.search(link)
+    if match:
+        pages = await asyncio.gather(*[
+            get_page(page) for page in range(2, int(match.group(1)) + 1)
+        ])
+        for page, _ in pages:
+            items.extend(page)
+    
+    return items
+
 
 @function_tool()
 async def get_repository(
@@ -43,30 +274,15 @@ async def get_repository(
     """
     logger.info(f"Getting GitHub repository: {request.owner}/{request.repo}")
     
-    # Get GitHub credentials from context
-    github_token = ctx.context.github_token if hasattr(ctx.context, 'github_token') else None
-    
-    # Create GitHub client
-    g = github.Github(github_token)
-    
     # Get repository
-    repo_name = f"{request.owner}/{request.repo}"
-    repo = g.get_repo(repo_name)
+    repo, _ = await _get_json(
+        _github_token(ctx), f"/repos/{request.owner}/{request.repo}", ttl=REPOSITORY_CACHE_TTL
+    )
     
     # Convert to our model
-    result = GitHubRepository(
-        name=repo.name,
-        full_name=repo.full_name,
-        description=repo.description,
-        url=repo.html_url,
-        default_branch=repo.default_branch,
-        stars=repo.stargazers_count,
-        forks=repo.forks_count,
-        open_issues=repo.open_issues_count,
-        language=repo.language
-    )
+    result = GitHubRepository.model_validate(repo)
     
-    logger.info(f"Retrieved GitHub repository: {repo.full_name}")
+    logger.info(f"Retrieved GitHub repository: {result.full_name}")
     return result
 
 
@@ -87,34 +303,13 @@ async def list_issues(
     """
     logger.info(f"Listing GitHub issues for {request.owner}/{request.repo} with state={request.state}")
     
-    # Get GitHub credentials from context
-    github_token = ctx.context.github_token if hasattr(ctx.context, 'github_token') else None
-    
-    # Create GitHub client
-    g = github.Github(github_token)
-    
-    # Get repository
-    repo_name = f"{request.owner}/{request.repo}"
-    repo = g.get_repo(repo_name)
-    
-    # Get issues
-    issues = repo.get_issues(state=request.state)
-    
-    # Convert to our model
-    result = []
-    for issue in issues:
-        issue_model = GitHubIssue(
-            number=issue.number,
-            title=issue.title,
-            body=issue.body,
-            state=issue.state,
-            created_at=issue.created_at.isoformat(),
-            updated_at=issue.updated_at.isoformat(),
-            url=issue.html_url,
-            labels=[label.name for label in issue.labels],
-            assignees=[assignee.login for assignee in issue.assignees]
-        )
-        result.append(issue_model)
+    # Get issues as models
+    result = await _get_all_pages(
+        _github_token(ctx),
+        f"/repos/{request.owner}/{request.repo}/issues",
+        {"state": request.state},
+        _ISSUES_ADAPTER
+    )
     
     logger.info(f"Retrieved {len(result)} GitHub issues")
     return result
@@ -137,38 +332,23 @@ async def create_issue(
     """
     logger.info(f"Creating GitHub issue in {request.owner}/{request.repo}: {request.title}")
     
-    # Get GitHub credentials from context
-    github_token = ctx.context.github_token if hasattr(ctx.context, 'github_token') else None
-    
-    # Create GitHub client
-    g = github.Github(github_token)
-    
-    # Get repository
-    repo_name = f"{request.owner}/{request.repo}"
-    repo = g.get_repo(repo_name)
-    
     # Create issue
-    issue = repo.create_issue(
-        title=request.title,
-        body=request.body,
-        labels=request.labels,
-        assignees=request.assignees
-    )
+    data = {"title": request.title, "body": request.body}
+    if request.labels is not None:
+        data["labels"] = request.labels
+    if request.assignees is not None:
+        data["assignees"] = request.assignees
+    url = f"/repos/{request.owner}/{request.repo}/issues"
+    response = await _request(_github_token(ctx), "POST", url, data=data)
+    
+    # Cached issue lists no longer include every issue
+    for key in [key for key in _cache if key[1] == url]:
+        del _cache[key]
     
     # Convert to our model
-    result = GitHubIssue(
-        number=issue.number,
-        title=issue.title,
-        body=issue.body,
-        state=issue.state,
-        created_at=issue.created_at.isoformat(),
-        updated_at=issue.updated_at.isoformat(),
-        url=issue.html_url,
-        labels=[label.name for label in issue.labels],
-        assignees=[assignee.login for assignee in issue.assignees]
-    )
+    result = GitHubIssue.model_validate_json(response.content)
     
-    logger.info(f"Created GitHub issue: {issue.html_url}")
+    logger.info(f"Created GitHub issue: {result.url}")
     return result
 
 
@@ -189,36 +369,13 @@ async def list_pull_requests(
     """
     logger.info(f"Listing GitHub PRs for {request.owner}/{request.repo} with state={request.state}")
     
-    # Get GitHub credentials from context
-    github_token = ctx.context.github_token if hasattr(ctx.context, 'github_token') else None
-    
-    # Create GitHub client
-    g = github.Github(github_token)
-    
-    # Get repository
-    repo_name = f"{request.owner}/{request.repo}"
-    repo = g.get_repo(repo_name)
-    
-    # Get pull requests
-    pulls = repo.get_pulls(state=request.state)
-    
-    # Convert to our model
-    result = []
-    for pr in pulls:
-        pr_model = GitHubPullRequest(
-            number=pr.number,
-            title=pr.title,
-            body=pr.body,
-            state=pr.state,
-            created_at=pr.created_at.isoformat(),
-            updated_at=pr.updated_at.isoformat(),
-            url=pr.html_url,
-            labels=[label.name for label in pr.labels],
-            assignees=[assignee.login for assignee in pr.assignees],
-            base_branch=pr.base.ref,
-            head_branch=pr.head.ref
-        )
-        result.append(pr_model)
+    # Get pull requests as models
+    result = await _get_all_pages(
+        _github_token(ctx),
+        f"/repos/{request.owner}/{request.repo}/pulls",
+        {"state": request.state},
+        _PULL_REQUESTS_ADAPTER
+    )
     
     logger.info(f"Retrieved {len(result)} GitHub pull requests")
     return result
\ No newline at end of file
@@ -29,7 +29,7 @@ TEST_KEY_NAME = 'test-key'
 TEST_SECURITY_GROUP_NAME = 'test-sg'
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aws_credentials():
     """Create a test AWS credentials object."""
     return AWSCredentials(
@@ -40,25 +40,33 @@ def aws_credentials():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ec2_service(aws_credentials):
-    """Create a test EC2 service with mock credentials."""
+    """Create a test EC2 service with mock credentials, shared by all tests."""
     return EC2Service(credentials=aws_credentials, skip_verification=True)
 
 
-@mock_aws
+@pytest.fixture(scope="session")
+def ec2_client():
+    """Create an EC2 client for setting up test data, shared by all tests."""
+    return boto3.session.Session().client('ec2', region_name='us-east-1')
+
+
+@pytest.fixture(autouse=True)
+def aws_mock():
+    """Give each test a fresh mocked AWS; the shared clients are intercepted too."""
+    with mock_aws():
+        yield
+
+
 def test_list_instances_empty(ec2_service):
     """Test listing instances when none exist."""
     instances = ec2_service.list_instances()
     assert instances == []
 
 
-@mock_aws
-def test_create_and_list_instance(ec2_service):
+def test_create_and_list_instance(ec2_service, ec2_client):
     """Test creating and then listing an EC2 instance."""
-    # Create a mock EC2 client to set up test data
-    ec2_client = boto3.client('ec2', region_name='us-east-1')
-    
     # Create a test security group
     sg_response = ec2_client.create_security_group(
         GroupName=TEST_SECURITY_GROUP_NAME,
@@ -111,12 +119,8 @@ def test_create_and_list_instance(ec2_service):
         ec2_service.get_instance('i-nonexistent')
 
 
-@mock_aws
-def test_instance_lifecycle(ec2_service):
+def test_instance_lifecycle(ec2_service, ec2_client):
     """Test the full lifecycle of an EC2 instance: create, start, stop, terminate."""
-    # Create a mock EC2 client to set up test data
-    ec2_client = boto3.client('ec2', region_name='us-east-1')
-    
     # Create a test AMI
     image_response = ec2_client.register_image(
         Name='test-ami',
@@ -154,7 +158,6 @@ def test_instance_lifecycle(ec2_service):
     assert terminated_instance['State']['Name'] == 'terminated'
 
 
-@mock_aws
 def test_security_group_operations(ec2_service):
     """Test creating, listing, and deleting a security group."""
     # Create a security group
@@ -194,7 +197,6 @@ def test_security_group_operations(ec2_service):
         ec2_service.get_security_group(sg_id)
 
 
-@mock_aws
 def test_key_pair_operations(ec2_service):
     """Test creating, listing, and deleting a key pair."""
     # Create a key pair
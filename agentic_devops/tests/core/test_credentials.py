@@ -14,8 +14,10 @@ import json
 from src.core.credentials import (
     AWSCredentials,
     GitHubCredentials,
+    CredentialError,
     CredentialManager,
-    get_credential_manager
+    get_credential_manager,
+    refresh_env_snapshot
 )
 
 
@@ -88,6 +90,12 @@ class TestGitHubCredentials:
 class TestCredentialManager:
     """Tests for the CredentialManager class."""
 
+    @pytest.fixture(autouse=True)
+    def restore_env_snapshot(self):
+        """Re-read the real environment after each test."""
+        yield
+        refresh_env_snapshot()
+
     @patch.dict(os.environ, {
         "AWS_ACCESS_KEY_ID": "env-access-key",
         "AWS_SECRET_ACCESS_KEY": "env-secret-key",
@@ -96,6 +104,7 @@ class TestCredentialManager:
     })
     def test_get_aws_credentials(self):
         """Test getting AWS credentials from the manager."""
+        refresh_env_snapshot()
         manager = CredentialManager()
         
         # Default credentials
@@ -118,11 +127,43 @@ class TestCredentialManager:
     })
     def test_get_github_credentials(self):
         """Test getting GitHub credentials from the manager."""
+        refresh_env_snapshot()
         manager = CredentialManager()
         
         creds = manager.get_github_credentials()
         assert isinstance(creds, GitHubCredentials)
         assert creds.token == "env-token"
+    
+    @patch('boto3.Session')
+    def test_get_aws_credentials_from_profile(self, mock_session_class):
+        """Test getting AWS credentials from a named profile."""
+        mock_session = mock_session_class.return_value
+        mock_session.region_name = "eu-west-1"
+        mock_session.get_credentials.return_value = MagicMock(
+            access_key="profile-access-key",
+            secret_key="profile-secret-key",
+            token=None
+        )
+        manager = CredentialManager()
+        
+        creds = manager.get_aws_credentials(profile_name="deploy", region="us-east-2")
+        mock_session_class.assert_called_once_with(profile_name="deploy")
+        assert creds.access_key_id == "profile-access-key"
+        assert creds.profile == "deploy"
+        assert creds.region == "us-east-2"
+        
+        # The profile's credentials are loaded once and reused
+        assert manager.get_aws_credentials(profile_name="deploy").region == "eu-west-1"
+        mock_session_class.assert_called_once()
+    
+    @patch('boto3.Session')
+    def test_get_aws_credentials_missing_profile(self, mock_session_class):
+        """Test that a profile without credentials raises CredentialError."""
+        mock_session_class.return_value.get_credentials.return_value = None
+        manager = CredentialManager()
+        
+        with pytest.raises(CredentialError):
+            manager.get_aws_credentials(profile_name="missing")
 
 
 @patch('src.core.credentials.CredentialManager')
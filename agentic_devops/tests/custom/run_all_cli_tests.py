@@ -5,6 +5,16 @@ Script to run all CLI tests.
 import sys
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+def run_test_file(test_file):
+    """Run one test file in its own interpreter, capturing its output."""
+    return subprocess.run(
+        ["python", test_file],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True
+    )
 
 def run_all_tests():
     """Run all CLI tests."""
@@ -18,11 +28,15 @@ def run_all_tests():
         "run_cli_error_tests.py"
     ]
     
-    # Run each test file
+    # Run the test files concurrently, so their interpreter start-up and imports
+    # overlap, then print each file's output in order
+    with ThreadPoolExecutor(max_workers=len(test_files)) as executor:
+        results = list(executor.map(run_test_file, test_files))
+    
     all_passed = True
-    for test_file in test_files:
+    for test_file, result in zip(test_files, results):
         print(f"\n=== Running {test_file} ===")
-        result = subprocess.run(["python", test_file], capture_output=False)
+        print(result.stdout, end="")
         if result.returncode != 0:
             all_passed = False
     
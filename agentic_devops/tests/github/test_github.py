@@ -10,7 +10,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 import json
 
-from src.github.github import GitHubService
+from src.github.github import GitHubService, DEFAULT_CACHE_TTL
 from src.core.credentials import GitHubCredentials
 
 # Test data
@@ -246,4 +246,69 @@ def test_error_handling(github_service):
         github_service.get_repository(TEST_REPO_NAME, owner=TEST_REPO_OWNER)
     
     # Verify the exception message
-    assert "GitHub resource not found" in str(excinfo.value)
\ No newline at end of file
+    assert "GitHub resource not found" in str(excinfo.value)
+
+@pytest.mark.parametrize("endpoint, ttl", [
+    (f"repos/{TEST_REPO_OWNER}/{TEST_REPO_NAME}", 600),
+    ("user/repos", 600),
+    (f"orgs/{TEST_REPO_OWNER}/repos", 600),
+    (f"repos/{TEST_REPO_OWNER}/{TEST_REPO_NAME}/branches", 30),
+    (f"repos/{TEST_REPO_OWNER}/{TEST_REPO_NAME}/issues", DEFAULT_CACHE_TTL),
+    (f"repos/{TEST_REPO_OWNER}/{TEST_REPO_NAME}/pulls", DEFAULT_CACHE_TTL),
+    (f"repos/{TEST_REPO_OWNER}/{TEST_REPO_NAME}/actions/runs", DEFAULT_CACHE_TTL),
+])
+def test_cache_ttl_for_endpoint(endpoint, ttl):
+    """Test that only repository endpoints get the long repository cache TTL."""
+    assert GitHubService._ttl_for(endpoint) == ttl
+
+
+def test_deploy_to_aws_ec2(github_service):
+    """Test deploying a repository to EC2 with the AWS services mocked."""
+    from src.core.credentials import AWSCredentials
+
+    github_service.get_repository_bundle = MagicMock(return_value={
+        "repository": {
+            "name": TEST_REPO_NAME,
+            "full_name": f"{TEST_REPO_OWNER}/{TEST_REPO_NAME}",
+            "owner": {"login": TEST_REPO_OWNER},
+            "default_branch": TEST_BRANCH
+        },
+        "branch": {"name": TEST_BRANCH}
+    })
+    aws_credentials = AWSCredentials(region="eu-west-1", profile="deploy")
+
+    with patch("src.core.credentials.get_credential_manager") as get_manager, \
+            patch("src.aws.ec2.EC2Service") as ec2_service_class:
+        get_manager.return_value.get_aws_credentials.return_value = aws_credentials
+        ec2_service_class.return_value.deploy_from_github.return_value = {"status": "deployed"}
+
+        result = github_service.deploy_to_aws(
+            f"{TEST_REPO_OWNER}/{TEST_REPO_NAME}",
+            "ec2",
+            {"instance_id": "i-123"},
+            aws_region="eu-west-1",
+            aws_profile="deploy"
+        )
+
+    # Verify the credentials came from the requested profile and region
+    get_manager.return_value.get_aws_credentials.assert_called_once_with(
+        profile_name="deploy",
+        region="eu-west-1"
+    )
+    ec2_service_class.assert_called_once_with(credentials=aws_credentials)
+    ec2_service_class.return_value.deploy_from_github.assert_called_once_with(
+        instance_id="i-123",
+        repository=f"{TEST_REPO_OWNER}/{TEST_REPO_NAME}",
+        branch=TEST_BRANCH,
+        deploy_path="/var/www/html",
+        setup_script=None,
+        github_token=TEST_TOKEN
+    )
+
+    # Verify the result
+    assert result == {
+        "service": "ec2",
+        "repository": f"{TEST_REPO_OWNER}/{TEST_REPO_NAME}",
+        "branch": TEST_BRANCH,
+        "details": {"status": "deployed"}
+    }
@@ -0,0 +1,59 @@
+"""
+Unit tests for the package imports.
+
+These tests check that importing the CLI does not pull in the AWS, HTTP or
+Agents SDK dependencies, which are only needed once a command runs.
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Root of the agentic_devops project, which contains the src package
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("module", ["boto3", "requests", "agents"])
+def test_cli_import_is_lazy(module):
+    """Test that importing src.cli does not import a heavy dependency."""
+    # Run in a fresh interpreter, since other tests have already imported everything
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, src.cli; print({module!r} in sys.modules)"],
+        cwd=PROJECT_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_package_reexports():
+    """Test that the package still re-exports names from its subpackages."""
+    import src
+    from src.core import SecurityCheckOutput
+    from src.github import GitHubIssue
+
+    assert src.GitHubIssue is GitHubIssue
+    assert src.SecurityCheckOutput is SecurityCheckOutput
+    assert "list_ec2_instances" in dir(src)
+
+    with pytest.raises(AttributeError):
+        src.not_a_real_name
+
+
+@pytest.mark.parametrize("package", ["src", "src.core"])
+def test_all_names_resolve(package):
+    """Test that every name in a package's __all__ resolves, lazily where listed."""
+    module = importlib.import_module(package)
+
+    for name in module.__all__:
+        subpackage = module._LAZY_IMPORTS.get(name)
+        if subpackage is None:
+            assert hasattr(module, name)
+        else:
+            source = importlib.import_module(f".{subpackage}", package)
+            assert module.__getattr__(name) is getattr(source, name)